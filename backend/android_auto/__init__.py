@@ -26,8 +26,23 @@ Author: OCTAVE Team
 License: GPLv3
 """
 
+import logging
+
 __version__ = "0.1.0"
 
+# Protobuf encode/decode runs for every AAP control message, so warn if the
+# C upb backend isn't active and the pure-Python runtime is in use
+try:
+    from google.protobuf.internal import api_implementation as _pb_implementation
+
+    if _pb_implementation.Type() != "upb":
+        logging.getLogger(__name__).warning(
+            "protobuf '%s' backend in use, install protobuf>=6.31.1 for the faster upb backend",
+            _pb_implementation.Type()
+        )
+except ImportError:
+    pass
+
 from .manager import AndroidAutoManager, HeadUnitInfo, AndroidAutoState, TransportMode
 from .usb_transport import USBTransport, USBDevice, DeviceState
 from .tcp_transport import TCPTransport, TCPState
@@ -39,6 +54,7 @@ from .constants import (
     ChannelId,
     VideoResolution,
     VideoFrameRate,
+    VideoHWAccel,
     AudioStreamType,
     AccessoryInfo,
 )
@@ -78,6 +94,7 @@ __all__ = [
     "ChannelId",
     "VideoResolution",
     "VideoFrameRate",
+    "VideoHWAccel",
     "AudioStreamType",
     "AccessoryInfo",
 ]
@@ -0,0 +1,107 @@
+"""
+Reusable Buffer Pool for Android Auto Streams
+
+Large reassembled messages (H.264 access units, audio chunks) arrive many
+times per second. Instead of allocating a fresh bytes object for each one,
+payloads are assembled into pooled bytearrays that are handed back to the
+pool once the message has been routed.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+
+class PooledBuffer:
+    """
+    A reference-counted buffer borrowed from a FramePool.
+
+    The buffer is returned to its pool when the last reference is released.
+    Data viewed through `view` is only valid until then - copy it with
+    bytes() to keep it longer, or retain() the buffer.
+    """
+
+    __slots__ = ('_pool', '_data', '_view', '_refs')
+
+    def __init__(self, pool: 'FramePool', capacity: int):
+        self._pool = pool
+        self._data = bytearray(capacity)
+        self._view: Optional[memoryview] = None
+        self._refs = 0
+
+    @property
+    def capacity(self) -> int:
+        """Get the allocated size of the buffer."""
+        return len(self._data)
+
+    @property
+    def view(self) -> memoryview:
+        """Get a writable view of the bytes in use."""
+        return self._view
+
+    def retain(self) -> 'PooledBuffer':
+        """Take an additional reference to the buffer."""
+        self._refs += 1
+        return self
+
+    def release(self):
+        """Drop a reference, returning the buffer to its pool on the last one."""
+        self._refs -= 1
+        if self._refs == 0:
+            self._view = None
+            self._pool._recycle(self)
+
+    def _reset(self, size: int):
+        """Prepare the buffer for a new owner using `size` bytes."""
+        self._view = memoryview(self._data)[:size]
+        self._refs = 1
+
+    def __len__(self) -> int:
+        return len(self._view) if self._view is not None else 0
+
+    def __enter__(self) -> 'PooledBuffer':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class FramePool:
+    """
+    Pool of reusable PooledBuffers, bucketed by power-of-two capacity.
+
+    Thread-safe: buffers may be acquired on one thread and released on another.
+    """
+
+    MIN_CAPACITY = 4096
+
+    def __init__(self, max_free_per_size: int = 4):
+        self._max_free = max_free_per_size
+        self._free: Dict[int, List[PooledBuffer]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, size: int) -> PooledBuffer:
+        """Get a buffer with at least `size` bytes, holding one reference."""
+        capacity = max(self.MIN_CAPACITY, 1 << (size - 1).bit_length())
+
+        buffer = None
+        with self._lock:
+            free = self._free.get(capacity)
+            if free:
+                buffer = free.pop()
+
+        if buffer is None:
+            buffer = PooledBuffer(self, capacity)
+
+        buffer._reset(size)
+        return buffer
+
+    def release(self, buffer: PooledBuffer):
+        """Drop a reference to a buffer acquired from this pool."""
+        buffer.release()
+
+    def _recycle(self, buffer: PooledBuffer):
+        """Keep a fully released buffer for reuse, up to the per-size limit."""
+        with self._lock:
+            free = self._free.setdefault(buffer.capacity, [])
+            if len(free) < self._max_free:
+                free.append(buffer)
@@ -6,10 +6,97 @@ This script compiles all .proto files from the aasdk library into
 Python modules that can be used by OCTAVE's Android Auto implementation.
 """
 
+import hashlib
+import json
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List
+
+# Sidecar in the output directory recording the content hash of each
+# .proto file as of its last successful compile
+CACHE_FILE_NAME = ".proto_cache.json"
+
+
+def find_files(root: Path, suffix: str) -> List[str]:
+    """Recursively collect paths of files ending with suffix using os.scandir."""
+    found = []
+    pending = [str(root)]
+
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    found.append(entry.path)
+
+    return found
+
+
+def run_protoc(proto_dir: Path, output_dir: Path, cwd: Path, proto_files: List[str]):
+    """Run a single protoc invocation over a batch of .proto files."""
+    cmd = [
+        sys.executable, "-m", "grpc_tools.protoc",
+        f"--proto_path={proto_dir}",
+        f"--python_out={output_dir}",
+        f"--pyi_out={output_dir}",
+        *proto_files,
+    ]
+
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        cwd=str(cwd)
+    )
+
+
+def hash_file(path: str) -> str:
+    """Return a short content hash of a file."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def load_cache(cache_path: Path) -> Dict[str, str]:
+    """Load the {relative proto path: hash} cache, or an empty one."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, str]):
+    """Persist the proto hash cache."""
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def check_protobuf_backend() -> bool:
+    """Report which protobuf runtime the generated modules will run on.
+
+    The generated _pb2 modules are plain descriptors; encode/decode speed
+    comes entirely from the runtime backend. The protobuf>=6.31.1 runtime
+    they require ships the C upb backend, which is much faster than the
+    pure-Python fallback on the AAP hot path.
+    """
+    try:
+        from google.protobuf.internal import api_implementation
+    except ImportError:
+        print("Warning: protobuf package not installed")
+        return False
+
+    backend = api_implementation.Type()
+    if backend != "upb":
+        print(f"Warning: protobuf is using the '{backend}' backend, install protobuf>=6.31.1 for the C upb backend")
+        return False
+
+    print("protobuf runtime backend: upb")
+    return True
 
 
 def compile_protos():
@@ -32,68 +119,97 @@ def compile_protos():
         return False
 
     # Find all .proto files
-    proto_files = list(aasdk_proto_dir.rglob("*.proto"))
+    proto_files = find_files(aasdk_proto_dir, ".proto")
 
     if not proto_files:
         print("No .proto files found!")
         return False
 
-    print(f"Found {len(proto_files)} proto files to compile...")
+    # Skip protos whose content is unchanged since their last successful
+    # compile and whose output still exists. Content hashes rather than
+    # mtimes, so VCS checkouts that touch files don't force a rebuild.
+    cache_path = output_dir / CACHE_FILE_NAME
+    cache = load_cache(cache_path)
+    hashes = {}
+    stale = []
 
-    # Compile using grpcio-tools
-    # We need to set the include paths correctly
-    include_paths = [
-        str(aasdk_proto_dir),
-        str(aasdk_proto_dir / "aap_protobuf"),
-    ]
+    for proto_file in proto_files:
+        rel_path = os.path.relpath(proto_file, aasdk_proto_dir)
+        hashes[proto_file] = hash_file(proto_file)
+        out_file = output_dir / (os.path.splitext(rel_path)[0] + "_pb2.py")
+
+        if cache.get(rel_path) == hashes[proto_file] and out_file.exists():
+            continue
+        stale.append(proto_file)
 
-    # Build the protoc command
-    python_exe = sys.executable
+    print(f"Found {len(proto_files)} proto files, {len(stale)} need compiling...")
 
     compiled = 0
     errors = 0
+    succeeded = []
 
-    for proto_file in proto_files:
-        try:
-            # Use python -m grpc_tools.protoc
-            cmd = [
-                python_exe, "-m", "grpc_tools.protoc",
-                f"--proto_path={aasdk_proto_dir}",
-                f"--python_out={output_dir}",
-                str(proto_file)
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(base_dir)
-            )
-
-            if result.returncode == 0:
-                compiled += 1
-                print(f"  OK: {proto_file.name}")
-            else:
-                errors += 1
-                print(f"  FAIL: {proto_file.name}: {result.stderr.strip()}")
-
-        except Exception as e:
-            errors += 1
-            print(f"  FAIL: {proto_file.name}: {e}")
+    if stale:
+        # protoc accepts many inputs per invocation, so pay the Python/grpc_tools
+        # startup cost once per batch instead of once per file, and run one batch
+        # per CPU in parallel
+        workers = min(len(stale), os.cpu_count() or 1)
+        batches = [stale[i::workers] for i in range(workers)]
+
+        def run_batch(batch):
+            # A failed launch (e.g. OSError) must not abort the other batches;
+            # None sends the batch to the file-by-file retry below
+            try:
+                return run_protoc(aasdk_proto_dir, output_dir, base_dir, batch)
+            except Exception as e:
+                print(f"  Batch of {len(batch)} protos failed to run: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_batch, batches))
+
+        for batch, result in zip(batches, results):
+            if result is not None and result.returncode == 0:
+                succeeded.extend(batch)
+                for proto_file in batch:
+                    print(f"  OK: {os.path.basename(proto_file)}")
+                continue
+
+            # protoc stops at the first error, so retry this batch file by file
+            # to find out which protos actually failed
+            for proto_file in batch:
+                try:
+                    single = run_protoc(aasdk_proto_dir, output_dir, base_dir, [proto_file])
+                    if single.returncode == 0:
+                        succeeded.append(proto_file)
+                        print(f"  OK: {os.path.basename(proto_file)}")
+                    else:
+                        errors += 1
+                        print(f"  FAIL: {os.path.basename(proto_file)}: {single.stderr.strip()}")
+                except Exception as e:
+                    errors += 1
+                    print(f"  FAIL: {os.path.basename(proto_file)}: {e}")
+
+        compiled = len(succeeded)
+
+        for proto_file in succeeded:
+            cache[os.path.relpath(proto_file, aasdk_proto_dir)] = hashes[proto_file]
+        save_cache(cache_path, cache)
 
     print(f"\nCompilation complete: {compiled} succeeded, {errors} failed")
 
     # Create helper imports
     create_proto_imports(output_dir)
 
+    check_protobuf_backend()
+
     return errors == 0
 
 
 def create_proto_imports(output_dir: Path):
     """Create convenient import modules for the generated protos."""
 
-    # Find all generated _pb2.py files
-    pb2_files = list(output_dir.rglob("*_pb2.py"))
+    # Find all generated _pb2.py files (the .pyi stubs don't match the suffix)
+    pb2_files = find_files(output_dir, "_pb2.py")
 
     if not pb2_files:
         print("No generated files found to create imports for.")
@@ -112,11 +228,11 @@ def create_proto_imports(output_dir: Path):
     }
 
     for pb2_file in pb2_files:
-        rel_path = pb2_file.relative_to(output_dir)
-        module_path = str(rel_path.with_suffix("")).replace(os.sep, ".")
+        rel_path = os.path.relpath(pb2_file, output_dir)
+        module_path = os.path.splitext(rel_path)[0].replace(os.sep, ".")
 
         # Categorize
-        path_str = str(rel_path).lower()
+        path_str = rel_path.lower()
         if "control" in path_str:
             services["control"].append(module_path)
         elif "media" in path_str or "video" in path_str or "audio" in path_str:
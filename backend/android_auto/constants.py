@@ -5,7 +5,7 @@ These constants are derived from the Android Open Accessory Protocol (AOAP)
 specification and the aasdk library implementation.
 """
 
-from enum import IntEnum, auto
+from enum import Enum, IntEnum, auto
 
 
 # USB Vendor and Product IDs
@@ -47,6 +47,13 @@ class AccessoryInfo:
     SERIAL = "HU-AAAAAA001"
 
 
+# AOAP SEND_STRING payloads (index, NUL-terminated UTF-8), encoded once
+AOAP_ACCESSORY_STRINGS = tuple(
+    (string_type, getattr(AccessoryInfo, string_type.name).encode('utf-8') + b'\x00')
+    for string_type in AOAPStringType
+)
+
+
 # USB constants
 class USBConstants:
     """USB protocol constants."""
@@ -55,6 +62,10 @@ class USBConstants:
     ENDPOINT_OUT = 0x00
     TIMEOUT_MS = 5000  # Increased for slow phone response
     CONTROL_TRANSFER_TIMEOUT_MS = 5000
+    # Bytes requested per bulk IN transfer. Large transfers let libusb keep
+    # the endpoint busy for a whole video burst instead of returning every
+    # 16 KB; a short packet still completes the read early.
+    BULK_TRANSFER_SIZE = 1 << 20  # 1 MiB
 
 
 # AAP Frame constants (from aasdk)
@@ -119,6 +130,16 @@ class VideoFrameRate(IntEnum):
     FPS_60 = 2
 
 
+class VideoHWAccel(Enum):
+    """Hardware acceleration backend for H.264 decoding."""
+    AUTO = "auto"          # Try the platform's usual backends, then software
+    CUDA = "cuda"          # NVIDIA NVDEC
+    VAAPI = "vaapi"        # Intel/AMD on Linux
+    D3D11VA = "d3d11va"    # Direct3D 11 on Windows
+    VIDEOTOOLBOX = "videotoolbox"  # macOS
+    NONE = "none"          # Software decode only
+
+
 # Audio configuration
 class AudioStreamType(IntEnum):
     """Audio stream types."""
@@ -141,6 +162,30 @@ class MessageType(IntEnum):
     CONTROL = 4     # 0b0100 - Control message (1 << 2)
 
 
+# Plain int aliases for the per-frame hot path, where comparing against an
+# int avoids an enum class attribute lookup. The enums remain the public API.
+FRAME_MIDDLE = FrameType.MIDDLE.value
+FRAME_FIRST = FrameType.FIRST.value
+FRAME_LAST = FrameType.LAST.value
+FRAME_BULK = FrameType.BULK.value
+MSG_SPECIFIC = MessageType.SPECIFIC.value
+MSG_CONTROL = MessageType.CONTROL.value
+ENC_PLAIN = EncryptionType.PLAIN.value
+ENC_ENCRYPTED = EncryptionType.ENCRYPTED.value
+CHANNEL_CONTROL = ChannelId.CONTROL.value
+CHANNEL_VIDEO = ChannelId.VIDEO.value
+CHANNEL_MEDIA_AUDIO = ChannelId.MEDIA_AUDIO.value
+
+
+# Flags byte -> (FrameType, MessageType, EncryptionType), precomputed for all
+# 256 values so decoding a frame's flags is a single tuple index
+_FLAG_DECODE = tuple(
+    (FrameType(b & 0x03), MessageType(b & 0x04), EncryptionType(b & 0x08))
+    for b in range(256)
+)
+decode_flags = _FLAG_DECODE.__getitem__
+
+
 # Control message types
 class ControlMessageType(IntEnum):
     """Control channel message types."""
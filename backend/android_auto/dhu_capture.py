@@ -6,25 +6,54 @@ that can be displayed in QML. Also handles input forwarding.
 """
 
 import platform
+import zlib
 from typing import Optional
-import threading
 import time
 
-from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer, QByteArray, QBuffer
+# Fast frame hashing for change detection (optional, falls back to crc32)
+try:
+    import xxhash
+    _frame_hash = xxhash.xxh3_64_intdigest
+except ImportError:
+    _frame_hash = zlib.crc32
+
+from PySide6.QtCore import (
+    QObject, Signal, Slot, Property, QTimer, QByteArray, QBuffer,
+    QThread, QMetaObject, Qt,
+)
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtQuick import QQuickImageProvider
 
+_FORMAT_ARGB32 = QImage.Format_ARGB32
+
+# Consecutive identical frames before capture backs off to IDLE_INTERVAL_MS
+IDLE_FRAME_THRESHOLD = 15
+IDLE_INTERVAL_MS = 200
+
 if platform.system() == "Windows":
     import ctypes
     from ctypes import wintypes
 
-    user32 = ctypes.windll.user32
-    gdi32 = ctypes.windll.gdi32
+    # Private DLL handles so the prototypes below don't leak into other
+    # modules using ctypes.windll
+    user32 = ctypes.WinDLL('user32')
+    gdi32 = ctypes.WinDLL('gdi32')
+    dwmapi = ctypes.WinDLL('dwmapi')
 
     # Windows API constants
     SRCCOPY = 0x00CC0020
     DIB_RGB_COLORS = 0
     BI_RGB = 0
+    DWMWA_EXTENDED_FRAME_BOUNDS = 9
+
+    # Windows Graphics Capture backend (optional). Frames are captured by the
+    # compositor into a D3D11 frame pool and only mapped to CPU memory when
+    # they arrive, avoiding the per-frame PrintWindow round-trip.
+    try:
+        from windows_capture import WindowsCapture
+        _wgc_available = True
+    except ImportError:
+        _wgc_available = False
 
     class BITMAPINFOHEADER(ctypes.Structure):
         _fields_ = [
@@ -55,26 +84,280 @@ if platform.system() == "Windows":
             ('bottom', wintypes.LONG),
         ]
 
+    # Declare prototypes once so ctypes doesn't infer argument types on every
+    # call, and so handles are passed as full pointer-sized values
+    def _prototype(func, argtypes, restype):
+        func.argtypes = argtypes
+        func.restype = restype
+
+    _prototype(user32.GetClientRect, [wintypes.HWND, ctypes.POINTER(RECT)], wintypes.BOOL)
+    _prototype(user32.GetWindowRect, [wintypes.HWND, ctypes.POINTER(RECT)], wintypes.BOOL)
+    _prototype(user32.ClientToScreen, [wintypes.HWND, ctypes.POINTER(wintypes.POINT)], wintypes.BOOL)
+    _prototype(user32.GetDC, [wintypes.HWND], wintypes.HDC)
+    _prototype(user32.ReleaseDC, [wintypes.HWND, wintypes.HDC], ctypes.c_int)
+    _prototype(user32.PrintWindow, [wintypes.HWND, wintypes.HDC, wintypes.UINT], wintypes.BOOL)
+    _prototype(user32.GetWindowTextLengthW, [wintypes.HWND], ctypes.c_int)
+    _prototype(user32.GetWindowTextW, [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int], ctypes.c_int)
+    _prototype(user32.PostMessageW,
+               [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM], wintypes.BOOL)
+    _prototype(user32.SendMessageW,
+               [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM], wintypes.LPARAM)
+
+    _prototype(gdi32.CreateCompatibleDC, [wintypes.HDC], wintypes.HDC)
+    _prototype(gdi32.CreateDIBSection,
+               [wintypes.HDC, ctypes.POINTER(BITMAPINFO), wintypes.UINT,
+                ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD],
+               wintypes.HBITMAP)
+    _prototype(gdi32.SelectObject, [wintypes.HDC, wintypes.HGDIOBJ], wintypes.HGDIOBJ)
+    _prototype(gdi32.DeleteObject, [wintypes.HGDIOBJ], wintypes.BOOL)
+    _prototype(gdi32.DeleteDC, [wintypes.HDC], wintypes.BOOL)
+    _prototype(gdi32.GdiFlush, [], wintypes.BOOL)
+
+    _prototype(dwmapi.DwmGetWindowAttribute,
+               [wintypes.HWND, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD], ctypes.c_long)
+
+    # Hot-path callables resolved once, so per-frame/per-click code does a
+    # single global lookup instead of a DLL attribute lookup on every call
+    _GetClientRect = user32.GetClientRect
+    _PrintWindow = user32.PrintWindow
+    _PostMessageW = user32.PostMessageW
+    _GdiFlush = gdi32.GdiFlush
+    _byref = ctypes.byref
+else:
+    _wgc_available = False
+
 
 class DhuFrameProvider(QQuickImageProvider):
     """Provides captured DHU frames to QML."""
 
+    SLOT_COUNT = 3  # Triple buffering: latest, being read, being written
+
     def __init__(self):
         super().__init__(QQuickImageProvider.Image)
+        # Single producer (capture thread), single consumer (QML render
+        # thread) latest-value slot. Attribute stores and loads of a reference
+        # are atomic, so no lock is needed.
         self._current_image: Optional[QImage] = None
-        self._lock = threading.Lock()
+        self._reading_image: Optional[QImage] = None  # Last image handed to QML
+
+        # Preallocated frame slots, reused until the frame size changes
+        self._slots = []
 
     def requestImage(self, id: str, size, requestedSize):
-        with self._lock:
-            if self._current_image:
-                # PySide6 expects just the QImage, not a tuple
-                return self._current_image
-            # Return empty image if no frame yet
-            return QImage(800, 480, QImage.Format_RGB32)
+        image = self._current_image
+        if image is not None:
+            self._reading_image = image
+            # PySide6 expects just the QImage, not a tuple
+            return image
+        # Return empty image if no frame yet
+        return QImage(800, 480, QImage.Format_RGB32)
 
     def update_frame(self, image: QImage):
-        with self._lock:
-            self._current_image = image
+        """
+        Publish a new frame.
+
+        The image may alias a capture buffer that is reused for the next
+        frame, so its pixels are copied into a preallocated slot that is
+        neither the latest frame nor the one QML last requested. The
+        reference swap is what publishes it to the render thread.
+        """
+        width = image.width()
+        height = image.height()
+
+        slots = self._slots
+        if (not slots or slots[0].width() != width or slots[0].height() != height
+                or slots[0].format() != image.format()):
+            slots = [QImage(width, height, image.format()) for _ in range(self.SLOT_COUNT)]
+            self._slots = slots
+
+        current = self._current_image
+        reading = self._reading_image
+        for slot in slots:
+            if slot is not current and slot is not reading:
+                break
+
+        # bits() detaches if Qt still holds a reference to this slot,
+        # so a frame still in use is never overwritten in place
+        dst = memoryview(slot.bits())
+        src = memoryview(image.constBits())
+        dst_stride = slot.bytesPerLine()
+        src_stride = image.bytesPerLine()
+
+        if src_stride == dst_stride:
+            size = dst_stride * height
+            dst[:size] = src[:size]
+        else:
+            row_bytes = min(src_stride, dst_stride)
+            for y in range(height):
+                src_offset = y * src_stride
+                dst_offset = y * dst_stride
+                dst[dst_offset:dst_offset + row_bytes] = src[src_offset:src_offset + row_bytes]
+
+        self._current_image = slot
+
+
+class CaptureWorker(QObject):
+    """
+    Performs GDI capture of the DHU window on a dedicated thread,
+    so PrintWindow never blocks the Qt GUI thread.
+    """
+
+    frameReady = Signal()  # Emitted after a frame is published to the provider
+
+    def __init__(self, hwnd: int, frame_provider: DhuFrameProvider, interval_ms: int):
+        super().__init__()
+        self._hwnd = hwnd
+        self._frame_provider = frame_provider
+        self._interval_ms = interval_ms
+        self._timer: Optional[QTimer] = None
+
+        # Change detection: skip publishing frames identical to the last one
+        self._last_hash: Optional[int] = None
+        self._identical_count = 0
+
+        # Cached GDI capture surface (recreated only when the size changes)
+        self._cached_w: Optional[int] = None
+        self._cached_h: Optional[int] = None
+        self._mem_dc = None
+        self._bitmap = None
+        self._old_bitmap = None
+        self._dib_pixels = None  # ctypes view of the DIB section bits
+
+    @Slot()
+    def start(self):
+        """Start the capture timer (runs in the worker thread)."""
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._capture_frame)
+        self._timer.start(self._interval_ms)
+
+    @Slot()
+    def stop(self):
+        """Stop capturing and release GDI resources (runs in the worker thread)."""
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+
+        self._last_hash = None
+        self._identical_count = 0
+        self._release_gdi_surface()
+
+    def _capture_frame(self):
+        """Capture a single frame from the DHU window."""
+        if not self._hwnd:
+            return
+
+        try:
+            # Get window dimensions
+            rect = RECT()
+            if not _GetClientRect(self._hwnd, _byref(rect)):
+                return
+
+            width = rect.right - rect.left
+            height = rect.bottom - rect.top
+
+            if width <= 0 or height <= 0:
+                return
+
+            # Reuse the cached memory DC and DIB section unless the size changed
+            if not self._ensure_gdi_surface(width, height):
+                return
+
+            # Render window content straight into the DIB section
+            PW_CLIENTONLY = 0x1
+            _PrintWindow(self._hwnd, self._mem_dc, PW_CLIENTONLY)
+
+            # Make sure GDI has finished writing to the DIB bits
+            _GdiFlush()
+
+            # Skip frames whose content hasn't changed (static screens), and
+            # back off the capture rate while the window stays idle
+            frame_hash = _frame_hash(self._dib_pixels)
+            if frame_hash == self._last_hash:
+                self._identical_count += 1
+                if self._identical_count == IDLE_FRAME_THRESHOLD:
+                    self._timer.setInterval(IDLE_INTERVAL_MS)
+                return
+
+            self._last_hash = frame_hash
+            if self._identical_count >= IDLE_FRAME_THRESHOLD:
+                self._timer.setInterval(self._interval_ms)
+            self._identical_count = 0
+
+            # Wrap the DIB pixels in a QImage without copying (BGRA format);
+            # the frame provider takes its own copy on update
+            image = QImage(
+                self._dib_pixels, width, height,
+                width * 4, _FORMAT_ARGB32
+            )
+
+            # Update the frame provider
+            self._frame_provider.update_frame(image)
+            self.frameReady.emit()
+
+        except Exception as e:
+            print(f"[DhuCapture] Capture error: {e}")
+
+    def _ensure_gdi_surface(self, width: int, height: int) -> bool:
+        """Create (or reuse) the memory DC and DIB section used for capture."""
+        if self._mem_dc and width == self._cached_w and height == self._cached_h:
+            return True
+
+        self._release_gdi_surface()
+
+        hwnd_dc = user32.GetDC(self._hwnd)
+        if not hwnd_dc:
+            return False
+
+        try:
+            mem_dc = gdi32.CreateCompatibleDC(hwnd_dc)
+        finally:
+            user32.ReleaseDC(self._hwnd, hwnd_dc)
+
+        if not mem_dc:
+            return False
+
+        bmi = BITMAPINFO()
+        bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi.bmiHeader.biWidth = width
+        bmi.bmiHeader.biHeight = -height  # Negative for top-down
+        bmi.bmiHeader.biPlanes = 1
+        bmi.bmiHeader.biBitCount = 32
+        bmi.bmiHeader.biCompression = BI_RGB
+
+        # DIB section gives us a directly addressable pixel buffer,
+        # so no GetDIBits copy is needed per frame
+        bits = ctypes.c_void_p()
+        bitmap = gdi32.CreateDIBSection(
+            mem_dc, ctypes.byref(bmi), DIB_RGB_COLORS,
+            ctypes.byref(bits), None, 0
+        )
+        if not bitmap or not bits.value:
+            gdi32.DeleteDC(mem_dc)
+            return False
+
+        self._mem_dc = mem_dc
+        self._bitmap = bitmap
+        self._old_bitmap = gdi32.SelectObject(mem_dc, bitmap)
+        self._dib_pixels = (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)
+        self._cached_w = width
+        self._cached_h = height
+        return True
+
+    def _release_gdi_surface(self):
+        """Release the cached memory DC and DIB section."""
+        if self._mem_dc:
+            if self._old_bitmap:
+                gdi32.SelectObject(self._mem_dc, self._old_bitmap)
+            if self._bitmap:
+                gdi32.DeleteObject(self._bitmap)
+            gdi32.DeleteDC(self._mem_dc)
+
+        self._mem_dc = None
+        self._bitmap = None
+        self._old_bitmap = None
+        self._dib_pixels = None
+        self._cached_w = None
+        self._cached_h = None
 
 
 class DhuCapture(QObject):
@@ -88,16 +371,29 @@ class DhuCapture(QObject):
     captureStopped = Signal()
     error = Signal(str)
 
+    # Internal: posted from capture threads, at most one in flight
+    _frameQueued = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._hwnd: int = 0
         self._capturing = False
-        self._capture_timer: Optional[QTimer] = None
+        self._capture_thread: Optional[QThread] = None
+        self._capture_worker: Optional[CaptureWorker] = None
+        self._wgc_control = None  # Windows Graphics Capture session control
+        self._wgc_client_rect = (0, 0, 0, 0)  # Client area within captured frame
+        self._wgc_last_hash: Optional[int] = None  # Skips unchanged WGC frames
         self._frame_provider = DhuFrameProvider()
         self._target_fps = 30
         self._last_width = 0
         self._last_height = 0
 
+        # Set by the capture thread when it posts _frameQueued and cleared on
+        # this thread when that is delivered, so frames produced while the
+        # GUI is busy collapse into a single notification
+        self._frame_pending = False
+        self._frameQueued.connect(self._on_frame_queued, Qt.QueuedConnection)
+
     @property
     def frame_provider(self) -> DhuFrameProvider:
         """Get the image provider for QML."""
@@ -138,10 +434,21 @@ class DhuCapture(QObject):
         print(f"[DhuCapture] Starting capture of window {self._hwnd}")
         self._capturing = True
 
-        # Start capture timer
-        self._capture_timer = QTimer()
-        self._capture_timer.timeout.connect(self._capture_frame)
-        self._capture_timer.start(1000 // self._target_fps)
+        # Prefer Windows Graphics Capture, fall back to GDI polling
+        if _wgc_available and self._start_wgc_capture():
+            print("[DhuCapture] Using Windows Graphics Capture")
+            self.captureStarted.emit()
+            return
+
+        # Run GDI capture on a worker thread with its own timer
+        self._capture_thread = QThread()
+        self._capture_worker = CaptureWorker(
+            self._hwnd, self._frame_provider, 1000 // self._target_fps
+        )
+        self._capture_worker.moveToThread(self._capture_thread)
+        self._capture_worker.frameReady.connect(self._notify_frame, Qt.DirectConnection)
+        self._capture_thread.started.connect(self._capture_worker.start)
+        self._capture_thread.start()
 
         self.captureStarted.emit()
 
@@ -154,95 +461,129 @@ class DhuCapture(QObject):
         print("[DhuCapture] Stopping capture")
         self._capturing = False
 
-        if self._capture_timer:
-            self._capture_timer.stop()
-            self._capture_timer = None
+        if self._capture_thread:
+            if self._capture_thread.isRunning():
+                QMetaObject.invokeMethod(
+                    self._capture_worker, "stop", Qt.BlockingQueuedConnection
+                )
+                self._capture_thread.quit()
+                self._capture_thread.wait()
+            self._capture_thread = None
+            self._capture_worker = None
+
+        if self._wgc_control:
+            try:
+                self._wgc_control.stop()
+            except Exception as e:
+                print(f"[DhuCapture] Error stopping WGC session: {e}")
+            self._wgc_control = None
 
+        self._frame_pending = False
+        self._wgc_last_hash = None
         self.captureStopped.emit()
 
-    def _capture_frame(self):
-        """Capture a single frame from the DHU window."""
-        if not self._capturing or not self._hwnd:
-            return
+    def _notify_frame(self):
+        """Tell the GUI thread a frame was published (called on capture threads)."""
+        if not self._frame_pending:
+            self._frame_pending = True
+            self._frameQueued.emit()
+
+    @Slot()
+    def _on_frame_queued(self):
+        """Deliver frameReady for the latest published frame."""
+        self._frame_pending = False
+        self.frameReady.emit()
+
+    def _start_wgc_capture(self) -> bool:
+        """Start a Windows Graphics Capture session for the DHU window."""
+        length = user32.GetWindowTextLengthW(self._hwnd)
+        if length <= 0:
+            return False
+        title_buf = ctypes.create_unicode_buffer(length + 1)
+        user32.GetWindowTextW(self._hwnd, title_buf, length + 1)
+
+        self._wgc_client_rect = self._get_client_capture_rect()
 
         try:
-            # Get window dimensions
-            rect = RECT()
-            if not user32.GetClientRect(self._hwnd, ctypes.byref(rect)):
-                return
+            capture = WindowsCapture(
+                cursor_capture=False,
+                draw_border=False,
+                window_name=title_buf.value,
+            )
+
+            @capture.event
+            def on_frame_arrived(frame, capture_control):
+                if not self._capturing:
+                    capture_control.stop()
+                    return
+                self._on_wgc_frame(frame)
 
-            width = rect.right - rect.left
-            height = rect.bottom - rect.top
+            @capture.event
+            def on_closed():
+                print("[DhuCapture] WGC session closed")
 
-            if width <= 0 or height <= 0:
-                return
+            self._wgc_control = capture.start_free_threaded()
+            return True
 
-            # Get window DC
-            hwnd_dc = user32.GetDC(self._hwnd)
-            if not hwnd_dc:
+        except Exception as e:
+            print(f"[DhuCapture] WGC unavailable, falling back to GDI: {e}")
+            self._wgc_control = None
+            return False
+
+    def _get_client_capture_rect(self):
+        """
+        Get the client area as (left, top, width, height) relative to the
+        window bounds captured by WGC (which include the non-client frame).
+        """
+        bounds = RECT()
+        if dwmapi.DwmGetWindowAttribute(
+            self._hwnd, DWMWA_EXTENDED_FRAME_BOUNDS,
+            ctypes.byref(bounds), ctypes.sizeof(bounds)
+        ) != 0:
+            user32.GetWindowRect(self._hwnd, ctypes.byref(bounds))
+
+        origin = wintypes.POINT(0, 0)
+        user32.ClientToScreen(self._hwnd, ctypes.byref(origin))
+
+        client = RECT()
+        user32.GetClientRect(self._hwnd, ctypes.byref(client))
+
+        return (origin.x - bounds.left, origin.y - bounds.top, client.right, client.bottom)
+
+    def _on_wgc_frame(self, frame):
+        """Handle a frame delivered by the WGC frame pool (capture thread)."""
+        try:
+            frame_w = frame.width
+            frame_h = frame.height
+            stride = frame_w * 4
+
+            left, top, width, height = self._wgc_client_rect
+            if (left < 0 or top < 0 or width <= 0 or height <= 0 or
+                    left + width > frame_w or top + height > frame_h):
+                # Client area unknown or window resized - use the whole frame
+                left, top, width, height = 0, 0, frame_w, frame_h
+
+            # Alias the mapped BGRA buffer, offset to the client area origin.
+            # Only the copy made by the frame provider touches memory.
+            pixels = memoryview(frame.frame_buffer).cast('B')
+
+            # The compositor also delivers frames for updates that leave the
+            # pixels unchanged; keep the previously published frame for those
+            frame_hash = _frame_hash(pixels)
+            if frame_hash == self._wgc_last_hash:
                 return
+            self._wgc_last_hash = frame_hash
+            offset = top * stride + left * 4
+            image = QImage(
+                pixels[offset:], width, height,
+                stride, _FORMAT_ARGB32
+            )
 
-            try:
-                # Create compatible DC and bitmap
-                mem_dc = gdi32.CreateCompatibleDC(hwnd_dc)
-                if not mem_dc:
-                    return
-
-                try:
-                    bitmap = gdi32.CreateCompatibleBitmap(hwnd_dc, width, height)
-                    if not bitmap:
-                        return
-
-                    try:
-                        # Select bitmap into memory DC
-                        old_bitmap = gdi32.SelectObject(mem_dc, bitmap)
-
-                        # Copy window content to memory DC
-                        # Use PrintWindow for better compatibility with some windows
-                        PW_CLIENTONLY = 0x1
-                        user32.PrintWindow(self._hwnd, mem_dc, PW_CLIENTONLY)
-
-                        # Get bitmap data
-                        bmi = BITMAPINFO()
-                        bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-                        bmi.bmiHeader.biWidth = width
-                        bmi.bmiHeader.biHeight = -height  # Negative for top-down
-                        bmi.bmiHeader.biPlanes = 1
-                        bmi.bmiHeader.biBitCount = 32
-                        bmi.bmiHeader.biCompression = BI_RGB
-
-                        # Allocate buffer for pixel data
-                        buffer_size = width * height * 4
-                        buffer = (ctypes.c_ubyte * buffer_size)()
-
-                        # Get bitmap bits
-                        gdi32.GetDIBits(
-                            mem_dc, bitmap, 0, height,
-                            buffer, ctypes.byref(bmi), DIB_RGB_COLORS
-                        )
-
-                        # Create QImage from buffer (BGRA format)
-                        image = QImage(
-                            bytes(buffer), width, height,
-                            width * 4, QImage.Format_ARGB32
-                        ).copy()  # Copy to own the data
-
-                        # Update the frame provider
-                        self._frame_provider.update_frame(image)
-                        self.frameReady.emit()
-
-                        # Restore old bitmap
-                        gdi32.SelectObject(mem_dc, old_bitmap)
-
-                    finally:
-                        gdi32.DeleteObject(bitmap)
-                finally:
-                    gdi32.DeleteDC(mem_dc)
-            finally:
-                user32.ReleaseDC(self._hwnd, hwnd_dc)
+            self._frame_provider.update_frame(image)
+            self._notify_frame()
 
         except Exception as e:
-            print(f"[DhuCapture] Capture error: {e}")
+            print(f"[DhuCapture] WGC frame error: {e}")
 
     @Slot(int, int)
     def sendMouseClick(self, x: int, y: int):
@@ -254,18 +595,9 @@ class DhuCapture(QObject):
             return
 
         try:
-            import time
-
-            # Save current cursor position to restore later
-            old_cursor = wintypes.POINT()
-            user32.GetCursorPos(ctypes.byref(old_cursor))
-
-            # Save current foreground window to restore focus
-            old_foreground = user32.GetForegroundWindow()
-
             # Get DHU client area size to scale coordinates properly
             client_rect = RECT()
-            user32.GetClientRect(self._hwnd, ctypes.byref(client_rect))
+            _GetClientRect(self._hwnd, _byref(client_rect))
             dhu_client_w = client_rect.right
             dhu_client_h = client_rect.bottom
 
@@ -277,68 +609,22 @@ class DhuCapture(QObject):
             else:
                 scaled_x, scaled_y = x, y
 
-            # Get window position info
-            window_rect = RECT()
-            user32.GetWindowRect(self._hwnd, ctypes.byref(window_rect))
-
-            screen_w = user32.GetSystemMetrics(0)
-            screen_h = user32.GetSystemMetrics(1)
-
-            win_w = window_rect.right - window_rect.left
-            win_h = window_rect.bottom - window_rect.top
-
-            # Position off the visible screen edge but technically on-screen
-            # Use coordinates just at the edge so it's minimally visible
-            temp_x = screen_w - win_w
-            temp_y = screen_h - win_h
-
-            # Make window nearly invisible using layered window
-            GWL_EXSTYLE = -20
-            WS_EX_LAYERED = 0x00080000
-            LWA_ALPHA = 0x00000002
-
-            old_style = user32.GetWindowLongW(self._hwnd, GWL_EXSTYLE)
-            user32.SetWindowLongW(self._hwnd, GWL_EXSTYLE, old_style | WS_EX_LAYERED)
-            user32.SetLayeredWindowAttributes(self._hwnd, 0, 1, LWA_ALPHA)
-
-            # Move window on-screen
-            SWP_NOSIZE = 0x0001
-            SWP_SHOWWINDOW = 0x0040
-            SWP_NOZORDER = 0x0004
-            user32.SetWindowPos(self._hwnd, 0, temp_x, temp_y, 0, 0,
-                               SWP_NOSIZE | SWP_SHOWWINDOW | SWP_NOZORDER)
-
-            # Brief activation
-            user32.SetForegroundWindow(self._hwnd)
-            time.sleep(0.02)
-
-            # Convert scaled client coords to screen coords
-            point = wintypes.POINT(scaled_x, scaled_y)
-            user32.ClientToScreen(self._hwnd, ctypes.byref(point))
-
-            # Click
-            user32.SetCursorPos(point.x, point.y)
-            MOUSEEVENTF_LEFTDOWN = 0x0002
-            MOUSEEVENTF_LEFTUP = 0x0004
-            user32.mouse_event(MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-            time.sleep(0.015)
-            user32.mouse_event(MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
-            time.sleep(0.02)
-
-            # Restore opacity for screen capture
-            user32.SetLayeredWindowAttributes(self._hwnd, 0, 255, LWA_ALPHA)
-
-            # Move window back off-screen
-            user32.SetWindowPos(self._hwnd, 0, -2000, -2000, 0, 0, SWP_NOSIZE | SWP_NOZORDER)
+            # Post the click straight to the window's message queue in client
+            # coordinates - no need to move the window on-screen or touch
+            # the real cursor/foreground window
+            WM_MOUSEMOVE = 0x0200
+            WM_LBUTTONDOWN = 0x0201
+            WM_LBUTTONUP = 0x0202
+            MK_LBUTTON = 0x0001
 
-            # Restore cursor position
-            user32.SetCursorPos(old_cursor.x, old_cursor.y)
+            lparam = ((scaled_y & 0xFFFF) << 16) | (scaled_x & 0xFFFF)
 
-            # Restore focus to OCTAVE
-            if old_foreground:
-                user32.SetForegroundWindow(old_foreground)
+            hwnd = self._hwnd
+            _PostMessageW(hwnd, WM_MOUSEMOVE, 0, lparam)
+            _PostMessageW(hwnd, WM_LBUTTONDOWN, MK_LBUTTON, lparam)
+            _PostMessageW(hwnd, WM_LBUTTONUP, 0, lparam)
 
-            print(f"[DhuCapture] Click ({x},{y}) -> scaled ({scaled_x},{scaled_y}) -> screen ({point.x},{point.y})")
+            print(f"[DhuCapture] Click ({x},{y}) -> scaled ({scaled_x},{scaled_y})")
 
         except Exception as e:
             print(f"[DhuCapture] Mouse click error: {e}")
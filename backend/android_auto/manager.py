@@ -16,22 +16,177 @@ import subprocess
 import os
 import platform
 import ctypes
-from typing import Optional, Callable, Union
+import queue
+import struct
+import sys
+import time
+import traceback
+from collections import deque
+from typing import Optional, Callable, Union, Tuple, List
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer
+from PySide6.QtCore import (
+    QObject, Signal, Slot, Property, QTimer, QMetaMethod, QRunnable, QThread, QThreadPool,
+    QProcess
+)
 from PySide6.QtGui import QWindow
 
-from .constants import ChannelId, ControlMessageType, AccessoryInfo
+from .constants import ChannelId, ControlMessageType, AccessoryInfo, FRAME_BULK, ENC_ENCRYPTED
 from .usb_transport import USBTransport, DeviceState
 from .tcp_transport import TCPTransport, TCPState
 from .message import Message, MessageAssembler, MessageRouter
+from .buffer_pool import FramePool
 from .ssl_handler import SSLHandler
 
+# Compiled protobuf messages (optional, see compile_protos.py)
+try:
+    from .proto.aap_protobuf.service.control.message import (
+        ChannelOpenRequest_pb2, ServiceDiscoveryRequest_pb2, ServiceDiscoveryResponse_pb2
+    )
+    _ChannelOpenRequest = ChannelOpenRequest_pb2.ChannelOpenRequest
+    _ServiceDiscoveryRequest = ServiceDiscoveryRequest_pb2.ServiceDiscoveryRequest
+    _ServiceDiscoveryResponse = ServiceDiscoveryResponse_pb2.ServiceDiscoveryResponse
+except Exception:
+    # ImportError, or protobuf's runtime_version.VersionError when the
+    # installed runtime is older than the generated code; importing the
+    # package must not fail either way
+    _ChannelOpenRequest = None
+    _ServiceDiscoveryRequest = None
+    _ServiceDiscoveryResponse = None
+
+# The channel open request carries no fields yet (channel_id/priority are
+# not set), so its encoding is fixed
+_CHANNEL_OPEN_REQUEST_PAYLOAD: Optional[bytes] = (
+    _ChannelOpenRequest().SerializeToString() if _ChannelOpenRequest is not None else None
+)
+
 logger = logging.getLogger(__name__)
 
+if platform.system() == "Windows":
+    from ctypes import wintypes
+
+    # Private handle so these prototypes don't affect other ctypes.windll users
+    _user32 = ctypes.WinDLL('user32')
+
+    _user32.FindWindowExW.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR]
+    _user32.FindWindowExW.restype = wintypes.HWND
+    _user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    _user32.GetWindowTextW.restype = ctypes.c_int
+    _user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    _user32.GetWindowTextLengthW.restype = ctypes.c_int
+    _user32.IsWindow.argtypes = [wintypes.HWND]
+    _user32.IsWindow.restype = wintypes.BOOL
+    _user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    _user32.IsWindowVisible.restype = wintypes.BOOL
+    _user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+    _user32.GetAncestor.restype = wintypes.HWND
+    _user32.SetWindowPos.argtypes = [
+        wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_int, wintypes.UINT
+    ]
+    _user32.SetWindowPos.restype = wintypes.BOOL
+
+    # WinEvent hook used to learn when the DHU shows its window
+    _WinEventProc = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+    )
+    _user32.SetWinEventHook.argtypes = [
+        wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, _WinEventProc,
+        wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+    ]
+    _user32.SetWinEventHook.restype = wintypes.HANDLE
+    _user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+    _user32.UnhookWinEvent.restype = wintypes.BOOL
+
+    _EVENT_OBJECT_SHOW = 0x8002
+    _WINEVENT_OUTOFCONTEXT = 0x0000
+    _OBJID_WINDOW = 0
+    _GA_ROOT = 2
+
+# Title fragments identifying the DHU window
+_DHU_WINDOW_TITLES = ("Desktop Head Unit", "Android Auto")
+_DHU_TITLE_MIN_LENGTH = min(len(fragment) for fragment in _DHU_WINDOW_TITLES)
+
+# Delay between DHU window searches: polling is the only way to find the
+# window without WinEvent hooks, and a slow safety net with them
+_DHU_WINDOW_POLL_MS = 1000
+_DHU_WINDOW_HOOKED_POLL_MS = 5000
+
+# Marks a tool path cache entry that hasn't been looked up yet
+# (None is a valid cached result meaning "not installed")
+_NOT_RESOLVED = object()
+
+# Windows profile locations searched for SDK tools, read once at import
+_USERPROFILE = os.environ.get("USERPROFILE", "")
+_LOCALAPPDATA = os.environ.get("LOCALAPPDATA", "")
+_USERNAME = os.environ.get("USERNAME", "")
+
+# How long a "not installed" tool lookup is trusted before searching again
+_TOOL_MISS_RETRY_SECONDS = 30.0
+
+
+def _dir_contains(parent: Path, name: str) -> bool:
+    """Check whether `parent` has an entry called `name` with one directory read."""
+    # normcase keeps the match case-insensitive on Windows, like Path.exists()
+    name = os.path.normcase(name)
+    try:
+        with os.scandir(parent) as entries:
+            return any(os.path.normcase(entry.name) == name for entry in entries)
+    except OSError:
+        return False
+
+
+# Printed after each command sent to the persistent adb shell, followed by
+# the command's exit status, to mark the end of its output
+_ADB_SHELL_SENTINEL = "__OCTAVE_EOF__"
+
+# Set OCTAVE_WIRE_DUMP=1 to include hex dumps of traffic in debug logging
+_WIRE_DUMP = os.environ.get("OCTAVE_WIRE_DUMP") == "1"
+
+# Raw AAP frame header (channel, flags, frame size, message id) and the
+# version exchange payload (major, minor)
+_FRAME_HDR = struct.Struct('>BBHH')
+_VER_PAYLOAD = struct.Struct('>HH')
+
+# A 6-byte header read as one big-endian integer is
+# channel(8) | flags(8) | size(16) | msg_id(16); VERSION_RESPONSE on the
+# control channel is recognised by masking out flags and size
+_VER_RESP_HDR_MASK = 0xFF000000FFFF
+_VER_RESP_HDR_VAL = (ChannelId.CONTROL << 40) | ControlMessageType.VERSION_RESPONSE
+
+# aasdk uses version 1.1
+AASDK_MAJOR = 1
+AASDK_MINOR = 1
+_VERSION_REQUEST_PAYLOAD = _VER_PAYLOAD.pack(AASDK_MAJOR, AASDK_MINOR)
+
+# Largest message (ID + payload) that fits a single frame, as in
+# Message.create_frame_data
+_MAX_FRAME_PAYLOAD = 16384
+
+# Android Auto package and the developer head unit server it hosts
+_GEARHEAD_PACKAGE = "com.google.android.projection.gearhead"
+_HEADUNIT_SERVICE = f"{_GEARHEAD_PACKAGE}/.companion.DeveloperHeadUnitNetworkService"
+
+
+class _AdbPrepRunnable(QRunnable):
+    """Runs the blocking ADB preparation on a QThreadPool worker."""
+
+    def __init__(self, manager: 'AndroidAutoManager'):
+        super().__init__()
+        self._manager = manager
+
+    def run(self):
+        try:
+            ok = self._manager._prepare_adb_connection()
+        except Exception as e:
+            logger.error("[AA Manager] ADB preparation failed: %s", e)
+            ok = False
+        # Queued back to the manager's thread
+        self._manager._adbPrepared.emit(ok)
+
 
 class TransportMode(Enum):
     """Transport connection mode."""
@@ -63,14 +218,18 @@ class HeadUnitInfo:
 
 
 class AndroidAutoState:
-    """Android Auto connection states."""
-    DISCONNECTED = "disconnected"
-    CONNECTING = "connecting"
-    SSL_HANDSHAKE = "ssl_handshake"
-    SERVICE_DISCOVERY = "service_discovery"
-    CONNECTED = "connected"
-    STREAMING = "streaming"
-    ERROR = "error"
+    """
+    Android Auto connection states.
+
+    The values are interned so the manager can compare states by identity.
+    """
+    DISCONNECTED = sys.intern("disconnected")
+    CONNECTING = sys.intern("connecting")
+    SSL_HANDSHAKE = sys.intern("ssl_handshake")
+    SERVICE_DISCOVERY = sys.intern("service_discovery")
+    CONNECTED = sys.intern("connected")
+    STREAMING = sys.intern("streaming")
+    ERROR = sys.intern("error")
 
 
 class AndroidAutoManager(QObject):
@@ -100,8 +259,11 @@ class AndroidAutoManager(QObject):
     stateChanged = Signal(str)
     transportModeChanged = Signal(str)  # TransportMode value
     connectionProgress = Signal(str)  # Human-readable status
-    videoFrameReady = Signal(object)  # Video frame data
+    # Stream payloads are owned bytes, safe to hold or deliver queued; see
+    # set_video_sink() for zero-copy video delivery
+    videoFrameReady = Signal(bytes)  # Video frame data
     audioDataReady = Signal(bytes, int)  # Audio data, stream type
+    audioBatchReady = Signal(list)  # [(audio data, stream type), ...] queued since last batch
     navigationUpdate = Signal(object)  # Navigation data
     phoneStatusChanged = Signal(object)  # Phone status
     mediaStatusChanged = Signal(object)  # Media playback status
@@ -109,6 +271,10 @@ class AndroidAutoManager(QObject):
     dhuWindowReady = Signal(int)  # Emits window handle when DHU window is found
     dhuEmbeddedChanged = Signal(bool)  # Emits when DHU embedding state changes
 
+    # Internal: results and progress posted from worker threads
+    _adbPrepared = Signal(bool)
+    _progressPosted = Signal(str)
+
     def __init__(self, head_unit_info: Optional[HeadUnitInfo] = None, parent=None):
         super().__init__(parent)
 
@@ -116,53 +282,156 @@ class AndroidAutoManager(QObject):
         self._state = AndroidAutoState.DISCONNECTED
         self._running = False
         self._transport_mode = TransportMode.USB
-
-        # Transport layers (create both, use one at a time)
-        self._usb_transport = USBTransport(self)
-        self._tcp_transport = TCPTransport(parent=self)
+        self._transport_mode_value = TransportMode.USB.value
+
+        # Cached SDK tool locations (resolved lazily, see refreshToolPaths)
+        self._dhu_path_cache = _NOT_RESOLVED
+        self._adb_path_cache = _NOT_RESOLVED
+        self._dhu_path_retry_at = 0.0
+        self._adb_path_retry_at = 0.0
+
+        # Persistent `adb shell` for device-side commands (opened on first use)
+        self._adb_shell: Optional[subprocess.Popen] = None
+        self._adb_shell_output: Optional[queue.Queue] = None
+        self._adb_shell_lock = threading.Lock()
+
+        # Set to abort waiting for the phone's head unit server
+        self._adb_wait_cancelled = threading.Event()
+
+        # connectionProgress is debounced to one emission per frame; bursts
+        # of updates collapse to the latest text
+        self._progress_text = ""
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._progressPosted.connect(self._report_progress)
+
+        # Step to run on the GUI thread once background ADB preparation succeeds
+        self._adb_ready_callback: Optional[Callable[[], None]] = None
+        self._adbPrepared.connect(self._on_adb_prepared)
+
+        # Transport layers (created on first use, one active at a time)
+        self._usb_transport: Optional[USBTransport] = None
+        self._tcp_transport: Optional[TCPTransport] = None
         self._active_transport: Union[USBTransport, TCPTransport, None] = None
 
-        # Message handling
-        self._message_assembler = MessageAssembler()
+        # Message handling - stream channels reassemble into pooled buffers
+        self._frame_pool = FramePool()
+        self._message_assembler = MessageAssembler(
+            self._frame_pool,
+            pooled_channels=(
+                ChannelId.VIDEO,
+                ChannelId.MEDIA_AUDIO,
+                ChannelId.SPEECH_AUDIO,
+                ChannelId.SYSTEM_AUDIO,
+            )
+        )
         self._message_router = MessageRouter()
 
+        # Audio packets queued for a single batched emission per event loop
+        # pass; bounded, dropping the oldest packet when full
+        self._audio_ring: deque = deque()
+        self._audio_ring_capacity = 64
+
+        # Direct video consumer called with pooled payloads (see set_video_sink)
+        self._video_sink: Optional[Callable[[Union[bytes, memoryview]], None]] = None
+
         # SSL handler for encrypted communication
         self._ssl_handler = SSLHandler()
         self._ssl_established = False
+        # Guards the wait for VERSION_RESPONSE (created per handshake)
+        self._version_response_timer: Optional[QTimer] = None
 
         # Service states
         self._services_discovered = False
         self._video_channel_open = False
         self._audio_channels_open = {}
 
-        # Connect USB transport signals
-        self._usb_transport.stateChanged.connect(self._on_usb_state_changed)
-        self._usb_transport.deviceConnected.connect(self._on_device_connected)
-        self._usb_transport.deviceDisconnected.connect(self._on_device_disconnected)
-        self._usb_transport.dataReceived.connect(self._on_data_received)
-        self._usb_transport.error.connect(self._on_transport_error)
-
-        # Connect TCP transport signals
-        self._tcp_transport.stateChanged.connect(self._on_tcp_state_changed)
-        self._tcp_transport.deviceConnected.connect(self._on_device_connected)
-        self._tcp_transport.deviceDisconnected.connect(self._on_device_disconnected)
-        self._tcp_transport.dataReceived.connect(self._on_data_received)
-        self._tcp_transport.error.connect(self._on_transport_error)
-
         # Register channel handlers
         self._setup_channel_handlers()
 
         # DHU window embedding/capture
-        self._dhu_process: Optional[subprocess.Popen] = None
+        self._dhu_process: Optional[QProcess] = None
         self._dhu_hwnd: int = 0  # Windows handle to DHU window
         self._dhu_embedded = False
 
+        # Waiting for the DHU window: the step to run once it appears, the
+        # WinEvent hook (and its ctypes callback, kept alive) and fallback poll
+        self._dhu_window_callback: Optional[Callable[[], None]] = None
+        self._dhu_window_hook = None
+        self._dhu_window_hook_proc = None
+        self._dhu_window_timer = QTimer(self)
+        self._dhu_window_timer.setSingleShot(True)
+        self._dhu_window_timer.timeout.connect(self._on_dhu_window_check)
+
         # DHU capture for seamless integration
         from .dhu_capture import DhuCapture
         self._dhu_capture = DhuCapture(self)
         self._dhu_capture.frameReady.connect(self._on_dhu_frame_ready)
         self._dhu_capture.error.connect(self._on_dhu_capture_error)
 
+        # Service discovery request payload, encoded once and reused on every
+        # connection (HeadUnitInfo is not changed after construction)
+        self._service_descriptor_bytes: bytes = self._build_service_descriptor(self._head_unit_info)
+
+        # Serialized frames for control messages whose content never changes,
+        # keyed by the encryption flag where it depends on the SSL state
+        self._version_request_frame = Message(
+            channel_id=ChannelId.CONTROL,
+            message_id=ControlMessageType.VERSION_REQUEST,
+            payload=_VERSION_REQUEST_PAYLOAD,
+            encrypted=False
+        ).create_frame_data()
+        self._auth_complete_frame = Message(
+            channel_id=ChannelId.CONTROL,
+            message_id=ControlMessageType.AUTH_COMPLETE,
+            payload=b'',
+            encrypted=False
+        ).create_frame_data()
+        self._service_discovery_frames = {
+            encrypted: Message(
+                channel_id=ChannelId.CONTROL,
+                message_id=ControlMessageType.SERVICE_DISCOVERY_REQUEST,
+                payload=self._service_descriptor_bytes,
+                encrypted=encrypted
+            ).create_frame_data()
+            for encrypted in (False, True)
+        }
+        self._channel_open_frames = {}
+
+        # Envelope reused by _send_payload for messages built per send
+        self._tx_message = Message(channel_id=0, message_id=0, payload=b'')
+        # Ping responses are framed in place here (pings carry a timestamp)
+        self._ping_resp_scratch = bytearray(256)
+
+        # Frames queued while a group of sends is coalesced (None = send now)
+        self._send_batch: Optional[list] = None
+
+    def _wire_transport_signals(self, transport: Union[USBTransport, TCPTransport],
+                                state_slot: Callable[[str], None]):
+        """Connect a newly created transport's signals to the manager."""
+        transport.stateChanged.connect(state_slot)
+        transport.deviceConnected.connect(self._on_device_connected)
+        transport.deviceDisconnected.connect(self._on_device_disconnected)
+        transport.dataReceived.connect(self._on_data_received)
+        transport.error.connect(self._on_transport_error)
+
+    def _report_progress(self, text: str):
+        """Queue a connectionProgress update, dropping any still pending."""
+        if QThread.currentThread() is not self.thread():
+            # The debounce timer lives on the manager's thread
+            self._progressPosted.emit(text)
+            return
+
+        self._progress_text = text
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Emit the most recent progress text."""
+        self.connectionProgress.emit(self._progress_text)
+
     def _setup_channel_handlers(self):
         """Set up message handlers for each channel."""
         self._message_router.register_handler(ChannelId.CONTROL, self._handle_control_message)
@@ -175,6 +444,17 @@ class AndroidAutoManager(QObject):
         self._message_router.register_handler(ChannelId.MEDIA_STATUS, self._handle_media_status)
         self._message_router.register_handler(ChannelId.INPUT, self._handle_input_feedback)
 
+        # Control channel handlers by message ID
+        self._control_handlers = {
+            ControlMessageType.VERSION_RESPONSE: self._handle_version_response,
+            ControlMessageType.SSL_HANDSHAKE: self._handle_ssl_data,
+            ControlMessageType.SERVICE_DISCOVERY_RESPONSE: self._handle_service_discovery_response,
+            ControlMessageType.CHANNEL_OPEN_RESPONSE: self._handle_channel_open_response,
+            ControlMessageType.PING_REQUEST: self._handle_ping_request,
+            ControlMessageType.NAV_FOCUS_NOTIFICATION: self._handle_nav_focus_notification,
+            ControlMessageType.AUDIO_FOCUS_REQUEST: self._handle_audio_focus_request,
+        }
+
     # Properties for QML binding
     @Property(str, notify=stateChanged)
     def state(self) -> str:
@@ -182,17 +462,29 @@ class AndroidAutoManager(QObject):
 
     @Property(bool, notify=stateChanged)
     def isConnected(self) -> bool:
-        return self._state in (AndroidAutoState.CONNECTED, AndroidAutoState.STREAMING)
+        state = self._state
+        return state is AndroidAutoState.CONNECTED or state is AndroidAutoState.STREAMING
 
     @Property(bool, notify=stateChanged)
     def isStreaming(self) -> bool:
-        return self._state == AndroidAutoState.STREAMING
+        return self._state is AndroidAutoState.STREAMING
 
     @Property(str, notify=transportModeChanged)
     def transportMode(self) -> str:
-        return self._transport_mode.value
+        return self._transport_mode_value
 
     # Public methods
+    def set_video_sink(self, sink: Optional[Callable[[Union[bytes, memoryview]], None]]):
+        """
+        Hand video payloads directly to `sink` (e.g. VideoDecoder.feed).
+
+        The sink is called synchronously on the manager's thread with a
+        memoryview into a pooled buffer that is reused once it returns, so
+        it must copy the data before returning. This avoids the extra copy
+        made for videoFrameReady, which is only emitted when it has receivers.
+        """
+        self._video_sink = sink
+
     @Slot()
     def start(self):
         """Start Android Auto service in USB mode (default)."""
@@ -204,15 +496,19 @@ class AndroidAutoManager(QObject):
         if self._running:
             self.stop()
 
-        logger.info("Starting Android Auto manager (USB mode)")
-        print("[AA Manager] Starting in USB mode")
+        logger.info("[AA Manager] Starting in USB mode")
+        if self._usb_transport is None:
+            self._usb_transport = USBTransport(self)
+            self._wire_transport_signals(self._usb_transport, self._on_usb_state_changed)
+
         self._running = True
         self._transport_mode = TransportMode.USB
+        self._transport_mode_value = TransportMode.USB.value
         self._active_transport = self._usb_transport
-        self.transportModeChanged.emit(self._transport_mode.value)
+        self.transportModeChanged.emit(self._transport_mode_value)
         self._set_state(AndroidAutoState.DISCONNECTED)
         self._usb_transport.start()
-        self.connectionProgress.emit("Waiting for Android device (USB)...")
+        self._report_progress("Waiting for Android device (USB)...")
 
     @Slot()
     def startTcp(self, host: str = "127.0.0.1", port: int = 5277):
@@ -230,16 +526,20 @@ class AndroidAutoManager(QObject):
         if self._running:
             self.stop()
 
-        logger.info(f"Starting Android Auto manager (TCP mode: {host}:{port})")
-        print(f"[AA Manager] Starting in TCP mode ({host}:{port})")
+        logger.info("[AA Manager] Starting in TCP mode (%s:%s)", host, port)
+        if self._tcp_transport is None:
+            self._tcp_transport = TCPTransport(parent=self)
+            self._wire_transport_signals(self._tcp_transport, self._on_tcp_state_changed)
+
         self._running = True
         self._transport_mode = TransportMode.TCP
+        self._transport_mode_value = TransportMode.TCP.value
         self._active_transport = self._tcp_transport
         self._tcp_transport.set_host_port(host, port)
-        self.transportModeChanged.emit(self._transport_mode.value)
+        self.transportModeChanged.emit(self._transport_mode_value)
         self._set_state(AndroidAutoState.DISCONNECTED)
         self._tcp_transport.start()
-        self.connectionProgress.emit(f"Connecting to phone (TCP {host}:{port})...")
+        self._report_progress(f"Connecting to phone (TCP {host}:{port})...")
 
     @Slot()
     def stop(self):
@@ -251,10 +551,8 @@ class AndroidAutoManager(QObject):
         self._running = False
 
         # Stop the active transport
-        if self._transport_mode == TransportMode.USB:
-            self._usb_transport.stop()
-        else:
-            self._tcp_transport.stop()
+        if self._active_transport:
+            self._active_transport.stop()
 
         self._active_transport = None
         self._set_state(AndroidAutoState.DISCONNECTED)
@@ -265,9 +563,9 @@ class AndroidAutoManager(QObject):
         Full cleanup when OCTAVE is closing.
         Stops DHU, cleans up ADB connections, and stops head unit server on phone.
         """
-        print("[AA Manager] Cleaning up Android Auto...")
+        logger.info("[AA Manager] Cleaning up Android Auto...")
 
-        # Close any running DHU
+        # Close any running DHU (also aborts a background ADB preparation)
         self.closeDhu()
 
         # Stop the manager
@@ -279,13 +577,15 @@ class AndroidAutoManager(QObject):
             # Remove port forwards
             subprocess.run(
                 [str(adb_path), "forward", "--remove-all"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
             # Stop head unit server on phone
             self._stop_headunit_server(adb_path)
-            print("[AA Manager] Cleanup complete")
+            logger.info("[AA Manager] Cleanup complete")
+
+        self._close_adb_shell()
 
     @Slot(int, int)
     def sendTouchEvent(self, x: int, y: int):
@@ -335,17 +635,39 @@ class AndroidAutoManager(QObject):
         path = self._find_dhu_path()
         return str(path) if path else ""
 
+    @Slot()
+    def refreshToolPaths(self):
+        """Forget cached DHU/ADB locations so they are searched for again."""
+        self._dhu_path_cache = _NOT_RESOLVED
+        self._adb_path_cache = _NOT_RESOLVED
+
     def _find_dhu_path(self) -> Optional[Path]:
-        """Find the Google DHU executable path."""
+        """Find the Google DHU executable path (cached, misses for a short while)."""
+        cached = self._dhu_path_cache
+        if cached is _NOT_RESOLVED or (cached is None and time.monotonic() >= self._dhu_path_retry_at):
+            cached = self._dhu_path_cache = self._resolve_dhu_path()
+            self._dhu_path_retry_at = time.monotonic() + _TOOL_MISS_RETRY_SECONDS
+        return cached
+
+    def _find_adb_path(self) -> Optional[Path]:
+        """Find ADB executable path (cached, misses for a short while)."""
+        cached = self._adb_path_cache
+        if cached is _NOT_RESOLVED or (cached is None and time.monotonic() >= self._adb_path_retry_at):
+            cached = self._adb_path_cache = self._resolve_adb_path()
+            self._adb_path_retry_at = time.monotonic() + _TOOL_MISS_RETRY_SECONDS
+        return cached
+
+    def _resolve_dhu_path(self) -> Optional[Path]:
+        """Search the common SDK locations for the Google DHU executable."""
         system = platform.system()
 
         # Common SDK locations
         if system == "Windows":
             sdk_locations = [
-                Path(os.environ.get("LOCALAPPDATA", "")) / "Android" / "Sdk",
-                Path(os.environ.get("USERPROFILE", "")) / "AppData" / "Local" / "Android" / "Sdk",
+                Path(_LOCALAPPDATA) / "Android" / "Sdk",
+                Path(_USERPROFILE) / "AppData" / "Local" / "Android" / "Sdk",
                 Path("C:/Android/Sdk"),
-                Path("C:/Users") / os.environ.get("USERNAME", "") / "Android" / "Sdk",
+                Path("C:/Users") / _USERNAME / "Android" / "Sdk",
             ]
             dhu_name = "desktop-head-unit.exe"
         else:
@@ -357,16 +679,16 @@ class AndroidAutoManager(QObject):
             ]
             dhu_name = "desktop-head-unit"
 
-        # Check each SDK location
+        # Check each SDK location's DHU directory with a single listing
         for sdk_path in sdk_locations:
-            dhu_path = sdk_path / "extras" / "google" / "auto" / dhu_name
-            if dhu_path.exists():
-                return dhu_path
+            dhu_dir = sdk_path / "extras" / "google" / "auto"
+            if _dir_contains(dhu_dir, dhu_name):
+                return dhu_dir / dhu_name
 
         return None
 
-    def _find_adb_path(self) -> Optional[Path]:
-        """Find ADB executable path."""
+    def _resolve_adb_path(self) -> Optional[Path]:
+        """Search the common locations for the ADB executable."""
         system = platform.system()
 
         # Check common locations
@@ -374,10 +696,10 @@ class AndroidAutoManager(QObject):
             adb_name = "adb.exe"
             search_paths = [
                 # Downloaded platform-tools
-                Path(os.environ.get("USERPROFILE", "")) / "Downloads" / "platform-tools" / adb_name,
+                Path(_USERPROFILE) / "Downloads" / "platform-tools" / adb_name,
                 # Android SDK
-                Path(os.environ.get("LOCALAPPDATA", "")) / "Android" / "Sdk" / "platform-tools" / adb_name,
-                Path(os.environ.get("USERPROFILE", "")) / "AppData" / "Local" / "Android" / "Sdk" / "platform-tools" / adb_name,
+                Path(_LOCALAPPDATA) / "Android" / "Sdk" / "platform-tools" / adb_name,
+                Path(_USERPROFILE) / "AppData" / "Local" / "Android" / "Sdk" / "platform-tools" / adb_name,
             ]
         else:
             adb_name = "adb"
@@ -389,101 +711,197 @@ class AndroidAutoManager(QObject):
             ]
 
         for path in search_paths:
-            if path.exists():
+            if _dir_contains(path.parent, adb_name):
                 return path
 
         return None
 
-    def _is_headunit_server_running(self, adb_path) -> bool:
-        """Check if the head unit server is already running on the phone."""
+    def _open_adb_shell(self, adb_path) -> bool:
+        """Start the persistent `adb shell` process and its output reader."""
         try:
-            result = subprocess.run(
-                [str(adb_path), "shell", "dumpsys", "activity", "services",
-                 "com.google.android.projection.gearhead/.companion.DeveloperHeadUnitNetworkService"],
-                capture_output=True,
+            shell = subprocess.Popen(
+                [str(adb_path), "shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=5
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1
             )
-            # If the service is running, it will show up in the output
-            return "ServiceRecord" in result.stdout
-        except Exception:
+        except Exception as e:
+            logger.error("[AA Manager] Failed to open adb shell: %s", e)
             return False
 
+        output = queue.Queue()
+
+        def read_output():
+            for line in shell.stdout:
+                output.put(line)
+            output.put(None)  # EOF - shell exited
+
+        threading.Thread(target=read_output, daemon=True).start()
+
+        self._adb_shell = shell
+        self._adb_shell_output = output
+        return True
+
+    def _close_adb_shell(self):
+        """Terminate the persistent adb shell, if open."""
+        with self._adb_shell_lock:
+            self._discard_adb_shell()
+
+    def _discard_adb_shell(self):
+        """Terminate the persistent adb shell (caller holds the lock)."""
+        shell = self._adb_shell
+        self._adb_shell = None
+        self._adb_shell_output = None
+
+        if shell and shell.poll() is None:
+            try:
+                shell.stdin.close()
+                shell.wait(timeout=2)
+            except Exception:
+                shell.kill()
+
+    def _adb_exec(self, adb_path, command: str, timeout: float = 5.0) -> Tuple[int, str]:
+        """
+        Run a command in the persistent adb shell.
+
+        Avoids spawning a new adb process per device-side command. The shell
+        is (re)opened on demand, e.g. after the phone reconnects.
+
+        Returns:
+            Tuple of (exit status, output); status is -1 if the command
+            could not be run or timed out
+        """
+        with self._adb_shell_lock:
+            if self._adb_shell is None or self._adb_shell.poll() is not None:
+                if not self._open_adb_shell(adb_path):
+                    return -1, ""
+
+            shell = self._adb_shell
+            output = self._adb_shell_output
+
+            try:
+                shell.stdin.write(f"{command}; echo {_ADB_SHELL_SENTINEL} $?\n")
+                shell.stdin.flush()
+            except OSError:
+                self._discard_adb_shell()
+                return -1, ""
+
+            lines = []
+            deadline = time.monotonic() + timeout
+
+            while True:
+                try:
+                    line = output.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    # Output is now out of sync with our commands - start over
+                    logger.error("[AA Manager] adb shell command timed out: %s", command)
+                    self._discard_adb_shell()
+                    return -1, ""
+
+                if line is None:
+                    self._discard_adb_shell()
+                    return -1, ""
+
+                marker = line.find(_ADB_SHELL_SENTINEL)
+                if marker < 0:
+                    lines.append(line)
+                    continue
+
+                # Output without a trailing newline shares the sentinel's line
+                lines.append(line[:marker])
+                status = line[marker + len(_ADB_SHELL_SENTINEL):].strip()
+                return (int(status) if status.isdigit() else -1), "".join(lines)
+
+    def _is_headunit_server_running(self, adb_path) -> bool:
+        """Check if the head unit server is already running on the phone."""
+        _, output = self._adb_exec(
+            adb_path,
+            f"dumpsys activity services {_HEADUNIT_SERVICE}"
+        )
+        # If the service is running, it will show up in the output
+        return "ServiceRecord" in output
+
+    def _start_and_probe_headunit_server(self, adb_path, start_command: str, settle_seconds: int) -> bool:
+        """
+        Run a start command, wait for it to settle and probe the service in a
+        single shell round trip.
+
+        Returns True if the head unit server shows up afterwards.
+        """
+        _, output = self._adb_exec(
+            adb_path,
+            f"{start_command} >/dev/null 2>&1; sleep {settle_seconds}; "
+            f"dumpsys activity services {_HEADUNIT_SERVICE} | grep -c ServiceRecord",
+            timeout=settle_seconds + 10
+        )
+        count = output.strip()
+        return count.isdigit() and int(count) > 0
+
     def _start_headunit_server(self, adb_path) -> bool:
         """Start the head unit server on the phone via ADB."""
-        import time
-
         try:
-            print("[AA Manager] Starting head unit server on phone...")
-            self.connectionProgress.emit("Starting head unit server on phone...")
+            logger.info("[AA Manager] Starting head unit server on phone...")
+            self._report_progress("Starting head unit server on phone...")
 
             # Method 1: Try starting via activity (opens Android Auto and triggers server)
-            result = subprocess.run(
-                [str(adb_path), "shell", "am", "start",
-                 "-n", "com.google.android.projection.gearhead/.companion.MainActivity",
-                 "-a", "com.google.android.gms.car.action.START_HEAD_UNIT_SERVER"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            # Give it a moment to initialize
-            time.sleep(2)
-
-            # Check if it worked
-            if self._is_headunit_server_running(adb_path):
-                print("[AA Manager] Head unit server started successfully")
+            if self._start_and_probe_headunit_server(
+                adb_path,
+                f"am start -n {_GEARHEAD_PACKAGE}/.companion.MainActivity "
+                "-a com.google.android.gms.car.action.START_HEAD_UNIT_SERVER",
+                settle_seconds=2
+            ):
+                logger.info("[AA Manager] Head unit server started successfully")
                 return True
 
             # Method 2: Try direct service start (works on some Android versions)
-            result = subprocess.run(
-                [str(adb_path), "shell", "am", "startservice",
-                 "-n", "com.google.android.projection.gearhead/.companion.DeveloperHeadUnitNetworkService"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            time.sleep(1)
-
-            if self._is_headunit_server_running(adb_path):
-                print("[AA Manager] Head unit server started successfully")
+            if self._start_and_probe_headunit_server(
+                adb_path,
+                f"am startservice -n {_HEADUNIT_SERVICE}",
+                settle_seconds=1
+            ):
+                logger.info("[AA Manager] Head unit server started successfully")
                 return True
 
-            print("[AA Manager] Could not auto-start head unit server")
+            logger.warning("[AA Manager] Could not auto-start head unit server")
             return False
 
         except Exception as e:
-            print(f"[AA Manager] Error starting head unit server: {e}")
+            logger.error("[AA Manager] Error starting head unit server: %s", e)
             return False
 
     def _stop_headunit_server(self, adb_path) -> bool:
         """Stop the head unit server on the phone."""
         try:
-            print("[AA Manager] Stopping head unit server on phone...")
-            result = subprocess.run(
-                [str(adb_path), "shell", "am", "force-stop", "com.google.android.projection.gearhead"],
-                capture_output=True,
-                text=True,
-                timeout=10
+            logger.info("[AA Manager] Stopping head unit server on phone...")
+            status, _ = self._adb_exec(
+                adb_path, f"am force-stop {_GEARHEAD_PACKAGE}", timeout=10
             )
-            return result.returncode == 0
+            return status == 0
         except Exception as e:
-            print(f"[AA Manager] Error stopping head unit server: {e}")
+            logger.error("[AA Manager] Error stopping head unit server: %s", e)
             return False
 
     def _has_stale_connections(self, adb_path) -> bool:
         """Check if there are stale CLOSE_WAIT connections on port 5277."""
         try:
-            result = subprocess.run(
-                [str(adb_path), "shell", "netstat -tn 2>/dev/null | grep 5277 | grep -c CLOSE_WAIT || echo 0"],
-                capture_output=True,
-                text=True,
-                timeout=5
+            # ss filters in the kernel; older devices without it use netstat.
+            # Lines are counted here so the status checked is ss's own.
+            status, output = self._adb_exec(
+                adb_path, "ss -Htn state close-wait '( sport = :5277 )' 2>/dev/null"
             )
-            count = int(result.stdout.strip() or "0")
+            if status == 0:
+                count = sum(1 for line in output.splitlines() if line.strip())
+            else:
+                _, output = self._adb_exec(
+                    adb_path, "netstat -tn 2>/dev/null | grep 5277 | grep -c CLOSE_WAIT"
+                )
+                count = int(output.strip() or "0")
             if count > 3:  # More than a few stale connections
-                print(f"[AA Manager] Found {count} stale CLOSE_WAIT connections")
+                logger.info("[AA Manager] Found %s stale CLOSE_WAIT connections", count)
                 return True
             return False
         except Exception:
@@ -500,29 +918,34 @@ class AndroidAutoManager(QObject):
             return False
 
         try:
-            print("[AA Manager] Cleaning up ADB connections...")
-            self.connectionProgress.emit("Preparing connection...")
+            logger.info("[AA Manager] Cleaning up ADB connections...")
+            self._report_progress("Preparing connection...")
 
             # Remove all existing port forwards
             subprocess.run(
                 [str(adb_path), "forward", "--remove-all"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
-            print("[AA Manager] Removed existing port forwards")
+            logger.info("[AA Manager] Removed existing port forwards")
 
             # Only force-stop if we detect stale connections or explicitly requested
             needs_restart = force_restart or self._has_stale_connections(adb_path)
 
             if needs_restart:
-                print("[AA Manager] Stale connections detected, restarting Android Auto on phone...")
-                self.connectionProgress.emit("Clearing stale connections...")
+                logger.info("[AA Manager] Stale connections detected, restarting Android Auto on phone...")
+                self._report_progress("Clearing stale connections...")
                 self._stop_headunit_server(adb_path)
 
-                # Brief pause to let sockets clean up
-                import time
-                time.sleep(1)
+                # Wait for the sockets to clear, bounded in case they linger
+                deadline = time.monotonic() + 2.0
+                delay = 0.02
+                while time.monotonic() < deadline:
+                    if not self._has_stale_connections(adb_path):
+                        break
+                    time.sleep(delay)
+                    delay = min(delay * 1.5, 0.2)
 
                 # Restart the head unit server
                 self._start_headunit_server(adb_path)
@@ -530,10 +953,10 @@ class AndroidAutoManager(QObject):
             return True
 
         except subprocess.TimeoutExpired:
-            print("[AA Manager] ADB cleanup timed out")
+            logger.error("[AA Manager] ADB cleanup timed out")
             return False
         except Exception as e:
-            print(f"[AA Manager] ADB cleanup error: {e}")
+            logger.error("[AA Manager] ADB cleanup error: %s", e)
             return False
 
     def _setup_adb_forward(self) -> bool:
@@ -541,11 +964,11 @@ class AndroidAutoManager(QObject):
         adb_path = self._find_adb_path()
 
         if not adb_path:
-            print("[AA Manager] ADB not found")
+            logger.warning("[AA Manager] ADB not found")
             return False
 
         try:
-            print(f"[AA Manager] Running ADB forward: {adb_path}")
+            logger.info("[AA Manager] Running ADB forward: %s", adb_path)
             result = subprocess.run(
                 [str(adb_path), "forward", "tcp:5277", "tcp:5277"],
                 capture_output=True,
@@ -554,27 +977,29 @@ class AndroidAutoManager(QObject):
             )
 
             if result.returncode == 0:
-                print(f"[AA Manager] ADB forward successful: {result.stdout.strip()}")
+                logger.info("[AA Manager] ADB forward successful: %s", result.stdout.strip())
                 return True
             else:
-                print(f"[AA Manager] ADB forward failed: {result.stderr.strip()}")
+                logger.warning("[AA Manager] ADB forward failed: %s", result.stderr.strip())
                 return False
 
         except subprocess.TimeoutExpired:
-            print("[AA Manager] ADB forward timed out")
+            logger.error("[AA Manager] ADB forward timed out")
             return False
         except Exception as e:
-            print(f"[AA Manager] ADB forward error: {e}")
+            logger.error("[AA Manager] ADB forward error: %s", e)
             return False
 
     def _prepare_adb_connection(self) -> bool:
         """
         Full ADB preparation: cleanup stale connections, setup forwarding, and start head unit server.
         Returns True if successful.
+
+        Blocks for up to a minute; run it through _start_adb_preparation.
         """
         adb_path = self._find_adb_path()
         if not adb_path:
-            print("[AA Manager] ADB not found - cannot prepare connection")
+            logger.warning("[AA Manager] ADB not found - cannot prepare connection")
             self.error.emit("ADB not found. Install Android SDK platform-tools.")
             return False
 
@@ -582,26 +1007,28 @@ class AndroidAutoManager(QObject):
         try:
             result = subprocess.run(
                 [str(adb_path), "devices"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
-            lines = result.stdout.strip().split('\n')
-            devices = [l for l in lines[1:] if l.strip() and 'device' in l]
-            if not devices:
-                print("[AA Manager] No Android device connected")
+            # Ready devices are listed as "<serial>\tdevice"; other states
+            # (offline, unauthorized) don't count
+            output = result.stdout
+            device_count = output.count(b"\tdevice\n") + output.count(b"\tdevice\r\n")
+            if not device_count:
+                logger.warning("[AA Manager] No Android device connected")
                 self.error.emit("No Android device connected. Connect your phone via USB.")
                 return False
-            print(f"[AA Manager] Found {len(devices)} connected device(s)")
+            logger.info("[AA Manager] Found %s connected device(s)", device_count)
         except Exception as e:
-            print(f"[AA Manager] Failed to check devices: {e}")
+            logger.error("[AA Manager] Failed to check devices: %s", e)
             return False
 
         # Clean up any stale connections (will auto-restart server if needed)
         self._cleanup_adb_connections()
 
         # Setup fresh port forwarding
-        self.connectionProgress.emit("Setting up ADB port forwarding...")
+        self._report_progress("Setting up ADB port forwarding...")
         if not self._setup_adb_forward():
             self.error.emit("Failed to setup ADB port forwarding")
             return False
@@ -611,55 +1038,96 @@ class AndroidAutoManager(QObject):
             # Try to start it (may fail due to permissions)
             if not self._start_headunit_server(adb_path):
                 # Can't auto-start, prompt user and wait
-                print("[AA Manager] Please start 'Head unit server' manually on your phone")
-                self.connectionProgress.emit("Please start 'Head unit server' in Android Auto developer settings...")
-
-                # Wait for user to start the server (poll for up to 60 seconds)
-                import time
-                for i in range(60):
+                logger.info("[AA Manager] Please start 'Head unit server' manually on your phone")
+                self._report_progress("Please start 'Head unit server' in Android Auto developer settings...")
+
+                # Wait for user to start the server (poll for up to 60 seconds,
+                # backing off from 50 ms to 1 s between probes)
+                deadline = time.monotonic() + 60
+                next_update = time.monotonic() + 5
+                delay = 0.05
+                while True:
                     if self._is_headunit_server_running(adb_path):
-                        print("[AA Manager] Head unit server detected!")
-                        self.connectionProgress.emit("Head unit server started!")
+                        logger.info("[AA Manager] Head unit server detected!")
+                        self._report_progress("Head unit server started!")
                         time.sleep(0.5)  # Brief pause to let it fully initialize
                         break
-                    time.sleep(1)
+
+                    now = time.monotonic()
+                    if now >= deadline:
+                        logger.warning("[AA Manager] Timed out waiting for head unit server")
+                        self.error.emit("Head unit server not started. Please start it and try again.")
+                        return False
+
                     # Update message every 5 seconds
-                    if i > 0 and i % 5 == 0:
-                        remaining = 60 - i
-                        self.connectionProgress.emit(f"Waiting for head unit server... ({remaining}s)")
-                else:
-                    # Timed out
-                    print("[AA Manager] Timed out waiting for head unit server")
-                    self.error.emit("Head unit server not started. Please start it and try again.")
-                    return False
+                    if now >= next_update:
+                        next_update += 5
+                        self._report_progress(
+                            f"Waiting for head unit server... ({int(deadline - now)}s)")
+
+                    # Returns early if the DHU launch is cancelled
+                    if self._adb_wait_cancelled.wait(delay):
+                        logger.info("[AA Manager] Stopped waiting for head unit server")
+                        return False
+                    delay = min(delay * 1.5, 1.0)
         else:
-            print("[AA Manager] Head unit server already running")
+            logger.info("[AA Manager] Head unit server already running")
+
+        return True
+
+    def _start_adb_preparation(self, on_ready: Callable[[], None]) -> bool:
+        """
+        Run _prepare_adb_connection on the thread pool and call `on_ready` on
+        this thread if it succeeds.
+
+        Returns False if a preparation is already in progress; the request
+        is dropped and the pending one continues.
+        """
+        if self._adb_ready_callback is not None:
+            logger.warning("[AA Manager] ADB preparation already in progress")
+            self._report_progress("Already preparing ADB connection...")
+            return False
 
+        self._adb_wait_cancelled.clear()
+        self._adb_ready_callback = on_ready
+        QThreadPool.globalInstance().start(_AdbPrepRunnable(self))
         return True
 
+    @Slot(bool)
+    def _on_adb_prepared(self, ok: bool):
+        """Continue a launch once background ADB preparation has finished."""
+        on_ready = self._adb_ready_callback
+        self._adb_ready_callback = None
+
+        # Error already emitted by _prepare_adb_connection; skip if cancelled
+        if ok and on_ready and not self._adb_wait_cancelled.is_set():
+            on_ready()
+
     @Slot(result=bool)
     def launchGoogleDhu(self) -> bool:
         """
         Launch Google's official Desktop Head Unit in external window.
         Automatically handles ADB cleanup and port forwarding.
 
-        Returns True if successfully launched, False otherwise.
+        ADB preparation runs in the background and the DHU is launched once
+        it completes. Returns False if the DHU is not installed or a
+        preparation is already in progress.
         """
         dhu_path = self._find_dhu_path()
 
         if not dhu_path:
-            print("[AA Manager] Google DHU not found. Install via Android Studio SDK Manager.")
+            logger.warning("[AA Manager] Google DHU not found. Install via Android Studio SDK Manager.")
             self.error.emit("Google DHU not installed. Install 'Android Auto Desktop Head Unit Emulator' via Android Studio SDK Manager.")
             return False
 
-        try:
-            # Full ADB preparation: cleanup stale connections and setup fresh forwarding
-            if not self._prepare_adb_connection():
-                # Error already emitted by _prepare_adb_connection
-                return False
+        # Full ADB preparation: cleanup stale connections and setup fresh forwarding
+        return self._start_adb_preparation(lambda: self._launch_google_dhu_process(dhu_path))
 
-            print(f"[AA Manager] Launching Google DHU: {dhu_path}")
-            self.connectionProgress.emit("Launching Google Desktop Head Unit...")
+    def _launch_google_dhu_process(self, dhu_path: Path):
+        """Start the DHU in its own window once ADB is prepared."""
+        try:
+            logger.info("[AA Manager] Launching Google DHU: %s", dhu_path)
+            self._report_progress("Launching Google Desktop Head Unit...")
 
             # Launch DHU as separate process
             if platform.system() == "Windows":
@@ -675,13 +1143,11 @@ class AndroidAutoManager(QObject):
                     start_new_session=True
                 )
 
-            self.connectionProgress.emit("Google DHU launched. Start 'Head unit server' on your phone.")
-            return True
+            self._report_progress("Google DHU launched. Start 'Head unit server' on your phone.")
 
         except Exception as e:
-            print(f"[AA Manager] Failed to launch Google DHU: {e}")
+            logger.error("[AA Manager] Failed to launch Google DHU: %s", e)
             self.error.emit(f"Failed to launch Google DHU: {e}")
-            return False
 
     @Slot(result=str)
     def getDhuInstallInstructions(self) -> str:
@@ -713,40 +1179,50 @@ After installation, click "Launch Google DHU" button."""
             return 0
 
         try:
-            # Windows API functions
-            user32 = ctypes.windll.user32
-            EnumWindows = user32.EnumWindows
-            GetWindowTextW = user32.GetWindowTextW
-            GetWindowTextLengthW = user32.GetWindowTextLengthW
-            IsWindowVisible = user32.IsWindowVisible
-
-            WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int))
-
-            found_hwnd = [0]
-
-            def enum_callback(hwnd, lParam):
-                # Convert hwnd pointer to int for API calls
-                hwnd_int = ctypes.cast(hwnd, ctypes.c_void_p).value or 0
-                if IsWindowVisible(hwnd_int):
-                    length = GetWindowTextLengthW(hwnd_int)
-                    if length > 0:
-                        buffer = ctypes.create_unicode_buffer(length + 1)
-                        GetWindowTextW(hwnd_int, buffer, length + 1)
-                        title = buffer.value
-                        # DHU window title contains "Desktop Head Unit" or similar
-                        if "Desktop Head Unit" in title or "Android Auto" in title:
-                            found_hwnd[0] = hwnd_int
-                            print(f"[AA Manager] Found DHU window: '{title}' (hwnd={hwnd_int})")
-                            return False  # Stop enumeration
-                return True  # Continue enumeration
-
-            EnumWindows(WNDENUMPROC(enum_callback), 0)
-            return found_hwnd[0]
+            title_buffer = ctypes.create_unicode_buffer(256)
+
+            # The window found last time is usually still there
+            hwnd = self._dhu_hwnd
+            if hwnd and _user32.IsWindow(hwnd) and self._dhu_window_title(hwnd, title_buffer):
+                return hwnd
+
+            # Walk top-level windows with plain API calls instead of a Python
+            # EnumWindows callback, reusing one title buffer
+            FindWindowExW = _user32.FindWindowExW
+            hwnd = FindWindowExW(None, None, None, None)
+
+            while hwnd:
+                title = self._dhu_window_title(hwnd, title_buffer)
+                if title:
+                    logger.info("[AA Manager] Found DHU window: '%s' (hwnd=%s)", title, hwnd)
+                    return hwnd
+                hwnd = FindWindowExW(None, hwnd, None, None)
+
+            return 0
 
         except Exception as e:
-            print(f"[AA Manager] Error finding DHU window: {e}")
+            logger.error("[AA Manager] Error finding DHU window: %s", e)
             return 0
 
+    @staticmethod
+    def _dhu_window_title(hwnd: int, title_buffer) -> Optional[str]:
+        """Get the title of a visible window if it looks like the DHU, else None."""
+        if not _user32.IsWindowVisible(hwnd):
+            return None
+
+        # Titles too short to hold any fragment are rejected without copying
+        if _user32.GetWindowTextLengthW(hwnd) < _DHU_TITLE_MIN_LENGTH:
+            return None
+
+        if _user32.GetWindowTextW(hwnd, title_buffer, len(title_buffer)) <= 0:
+            return None
+
+        # DHU window title contains "Desktop Head Unit" or similar
+        title = title_buffer.value
+        if any(fragment in title for fragment in _DHU_WINDOW_TITLES):
+            return title
+        return None
+
     @Slot(result=bool)
     def launchGoogleDhuEmbedded(self) -> bool:
         """
@@ -760,46 +1236,31 @@ After installation, click "Launch Google DHU" button."""
         dhu_path = self._find_dhu_path()
 
         if not dhu_path:
-            print("[AA Manager] Google DHU not found.")
+            logger.warning("[AA Manager] Google DHU not found.")
             self.error.emit("Google DHU not installed.")
             return False
 
         try:
             # Setup ADB forwarding first
-            self.connectionProgress.emit("Setting up ADB port forwarding...")
+            self._report_progress("Setting up ADB port forwarding...")
             adb_success = self._setup_adb_forward()
             if not adb_success:
-                self.connectionProgress.emit("ADB forward failed - make sure phone is connected via USB")
+                self._report_progress("ADB forward failed - make sure phone is connected via USB")
 
-            print(f"[AA Manager] Launching Google DHU for embedding: {dhu_path}")
-            self.connectionProgress.emit("Launching Google Desktop Head Unit...")
+            logger.info("[AA Manager] Launching Google DHU for embedding: %s", dhu_path)
+            self._report_progress("Launching Google Desktop Head Unit...")
 
-            # Launch DHU as subprocess (not in new console, so we can track it)
-            if platform.system() == "Windows":
-                # Don't create new console - we want to embed the window
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 1  # SW_SHOWNORMAL
+            # Launch DHU as a tracked child process (not in new console)
+            self._start_dhu_process(dhu_path)
 
-                self._dhu_process = subprocess.Popen(
-                    [str(dhu_path)],
-                    cwd=str(dhu_path.parent),
-                    startupinfo=startupinfo
-                )
-            else:
-                self._dhu_process = subprocess.Popen(
-                    [str(dhu_path)],
-                    cwd=str(dhu_path.parent)
-                )
-
-            # Start a timer to find the window after DHU starts
-            QTimer.singleShot(2000, self._try_find_dhu_window)
+            # Find the window once DHU shows it
+            self._wait_for_dhu_window(self._try_find_dhu_window)
 
-            self.connectionProgress.emit("Waiting for DHU window...")
+            self._report_progress("Waiting for DHU window...")
             return True
 
         except Exception as e:
-            print(f"[AA Manager] Failed to launch Google DHU: {e}")
+            logger.error("[AA Manager] Failed to launch Google DHU: %s", e)
             self.error.emit(f"Failed to launch Google DHU: {e}")
             return False
 
@@ -808,18 +1269,124 @@ After installation, click "Launch Google DHU" button."""
         """Try to find the DHU window after launch."""
         hwnd = self._find_dhu_window()
         if hwnd:
+            self._stop_waiting_for_dhu_window()
             self._dhu_hwnd = hwnd
-            print(f"[AA Manager] DHU window found: {hwnd}")
+            logger.info("[AA Manager] DHU window found: %s", hwnd)
             self.dhuWindowReady.emit(hwnd)
-            self.connectionProgress.emit("DHU window ready for embedding")
+            self._report_progress("DHU window ready for embedding")
         else:
-            # Retry a few times
-            if self._dhu_process and self._dhu_process.poll() is None:
-                print("[AA Manager] DHU window not found yet, retrying...")
-                QTimer.singleShot(1000, self._try_find_dhu_window)
-            else:
-                print("[AA Manager] DHU process ended before window was found")
-                self.error.emit("DHU closed before window could be found")
+            # Keep waiting; _on_dhu_exited ends the wait if the DHU quits
+            logger.info("[AA Manager] DHU window not found yet, retrying...")
+            self._poll_for_dhu_window()
+
+    def _start_dhu_process(self, dhu_path: Path):
+        """Start the DHU as a QProcess whose exit is reported by finished()."""
+        process = QProcess(self)
+        process.setProgram(str(dhu_path))
+        process.setWorkingDirectory(str(dhu_path.parent))
+        # Share OCTAVE's console output like a plain child process; unread
+        # pipes would eventually stall the DHU
+        process.setProcessChannelMode(QProcess.ForwardedChannels)
+        process.finished.connect(self._on_dhu_exited)
+        process.start()
+
+        if not process.waitForStarted(5000):
+            error = process.errorString()
+            process.deleteLater()
+            raise RuntimeError(error)
+
+        self._dhu_process = process
+
+    @Slot(int, QProcess.ExitStatus)
+    def _on_dhu_exited(self, exit_code: int, exit_status: QProcess.ExitStatus):
+        """Handle the DHU quitting on its own (closeDhu disconnects first)."""
+        logger.info("[AA Manager] DHU process ended (exit code %s)", exit_code)
+
+        waiting_for = self._dhu_window_callback
+        self._stop_waiting_for_dhu_window()
+        self._dhu_capture.stopCapture()
+
+        if self._dhu_process:
+            self._dhu_process.deleteLater()
+            self._dhu_process = None
+
+        self._dhu_hwnd = 0
+        if self._dhu_embedded:
+            self._dhu_embedded = False
+            self.dhuEmbeddedChanged.emit(False)
+
+        if waiting_for == self._setup_seamless_capture:
+            self.error.emit("DHU closed unexpectedly")
+        elif waiting_for is not None:
+            self.error.emit("DHU closed before window could be found")
+
+    def _wait_for_dhu_window(self, on_found: Callable[[], None]):
+        """
+        Call `on_found` on this thread when the DHU window may be available.
+
+        On Windows a WinEvent hook on the DHU process reports the window as
+        soon as it is shown; polling is kept as a slow fallback.
+        """
+        self._stop_waiting_for_dhu_window()
+        self._dhu_window_callback = on_found
+        self._install_dhu_window_hook()
+        self._poll_for_dhu_window()
+
+    def _poll_for_dhu_window(self):
+        """Schedule the next fallback search for the DHU window."""
+        if self._dhu_window_hook:
+            self._dhu_window_timer.start(_DHU_WINDOW_HOOKED_POLL_MS)
+        else:
+            self._dhu_window_timer.start(_DHU_WINDOW_POLL_MS)
+
+    def _stop_waiting_for_dhu_window(self):
+        """Remove the DHU window hook and cancel the fallback search."""
+        self._dhu_window_timer.stop()
+        self._dhu_window_callback = None
+        if self._dhu_window_hook:
+            _user32.UnhookWinEvent(self._dhu_window_hook)
+        self._dhu_window_hook = None
+        self._dhu_window_hook_proc = None
+
+    @Slot()
+    def _on_dhu_window_check(self):
+        """Run the pending DHU window step (hook hit or fallback poll)."""
+        if self._dhu_window_callback:
+            self._dhu_window_callback()
+
+    def _install_dhu_window_hook(self) -> bool:
+        """Hook EVENT_OBJECT_SHOW for the DHU process. Returns True if installed."""
+        if platform.system() != "Windows" or not self._dhu_process:
+            return False
+
+        title_buffer = ctypes.create_unicode_buffer(256)
+
+        def on_window_shown(hook, event, hwnd, id_object, id_child, thread_id, timestamp):
+            # Runs on this thread from its message loop (out-of-context hook)
+            try:
+                if id_object != _OBJID_WINDOW or not hwnd or not self._dhu_window_callback:
+                    return
+                if _user32.GetAncestor(hwnd, _GA_ROOT) != hwnd:
+                    return
+                if self._dhu_window_title(hwnd, title_buffer):
+                    self._dhu_hwnd = hwnd
+                    # Leave the hook callback before acting on the window
+                    self._dhu_window_timer.start(0)
+            except Exception as e:
+                logger.error("[AA Manager] DHU window hook error: %s", e)
+
+        proc = _WinEventProc(on_window_shown)
+        hook = _user32.SetWinEventHook(
+            _EVENT_OBJECT_SHOW, _EVENT_OBJECT_SHOW, None, proc,
+            self._dhu_process.processId(), 0, _WINEVENT_OUTOFCONTEXT
+        )
+        if not hook:
+            logger.warning("[AA Manager] Could not hook DHU window events, polling instead")
+            return False
+
+        self._dhu_window_hook = hook
+        self._dhu_window_hook_proc = proc
+        return True
 
     @Slot(result=bool)
     def launchDhuSeamless(self) -> bool:
@@ -827,6 +1394,10 @@ After installation, click "Launch Google DHU" button."""
         Launch DHU and capture its output seamlessly into OCTAVE.
         The DHU window is hidden and its content is captured and displayed in QML.
         Automatically handles ADB cleanup and connection setup.
+
+        ADB preparation runs in the background and the DHU is launched once
+        it completes. Returns False if the DHU is not installed or a
+        preparation is already in progress.
         """
         # Close any existing DHU first
         if self._dhu_process or self._dhu_embedded:
@@ -835,64 +1406,47 @@ After installation, click "Launch Google DHU" button."""
         dhu_path = self._find_dhu_path()
 
         if not dhu_path:
-            print("[AA Manager] Google DHU not found.")
+            logger.warning("[AA Manager] Google DHU not found.")
             self.error.emit("Google DHU not installed.")
             return False
 
-        try:
-            # Full ADB preparation: cleanup stale connections and setup fresh forwarding
-            if not self._prepare_adb_connection():
-                # Error already emitted by _prepare_adb_connection
-                return False
+        # Full ADB preparation: cleanup stale connections and setup fresh forwarding
+        return self._start_adb_preparation(lambda: self._launch_seamless_dhu_process(dhu_path))
 
+    def _launch_seamless_dhu_process(self, dhu_path: Path):
+        """Start the DHU for capture once ADB is prepared."""
+        try:
             # Prompt user to start head unit server
-            self.connectionProgress.emit("Please start 'Head unit server' on your phone...")
+            self._report_progress("Please start 'Head unit server' on your phone...")
 
-            print(f"[AA Manager] Launching DHU for seamless capture: {dhu_path}")
+            logger.info("[AA Manager] Launching DHU for seamless capture: %s", dhu_path)
 
             # Launch DHU
-            if platform.system() == "Windows":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 1  # SW_SHOWNORMAL initially
-
-                self._dhu_process = subprocess.Popen(
-                    [str(dhu_path)],
-                    cwd=str(dhu_path.parent),
-                    startupinfo=startupinfo
-                )
-            else:
-                self._dhu_process = subprocess.Popen(
-                    [str(dhu_path)],
-                    cwd=str(dhu_path.parent)
-                )
+            self._start_dhu_process(dhu_path)
 
-            # Start timer to find window and begin capture
-            QTimer.singleShot(2000, self._setup_seamless_capture)
+            # Find the window and begin capture once DHU shows it
+            self._wait_for_dhu_window(self._setup_seamless_capture)
 
-            self.connectionProgress.emit("Starting Android Auto...")
-            return True
+            self._report_progress("Starting Android Auto...")
 
         except Exception as e:
-            print(f"[AA Manager] Failed to launch DHU: {e}")
+            logger.error("[AA Manager] Failed to launch DHU: %s", e)
             self.error.emit(f"Failed to launch DHU: {e}")
-            return False
 
     @Slot()
     def _setup_seamless_capture(self):
         """Find DHU window and start seamless capture."""
         hwnd = self._find_dhu_window()
         if hwnd:
+            self._stop_waiting_for_dhu_window()
             self._dhu_hwnd = hwnd
-            print(f"[AA Manager] DHU window found for capture: {hwnd}")
+            logger.info("[AA Manager] DHU window found for capture: %s", hwnd)
 
             # Hide the DHU window (move off-screen or minimize)
             if platform.system() == "Windows":
-                SW_HIDE = 0
                 # Don't fully hide - just move off screen so capture still works
-                user32 = ctypes.windll.user32
                 # Move window off-screen but keep it "visible" for capture
-                user32.SetWindowPos(hwnd, 0, -2000, -2000, 0, 0, 0x0001 | 0x0004)  # SWP_NOSIZE | SWP_NOZORDER
+                _user32.SetWindowPos(hwnd, None, -2000, -2000, 0, 0, 0x0001 | 0x0004)  # SWP_NOSIZE | SWP_NOZORDER
 
             # Start capturing
             self._dhu_capture.setWindowHandle(hwnd)
@@ -901,16 +1455,12 @@ After installation, click "Launch Google DHU" button."""
             self._dhu_embedded = True
             self.dhuEmbeddedChanged.emit(True)
             self.dhuWindowReady.emit(hwnd)
-            self.connectionProgress.emit("Android Auto running")
+            self._report_progress("Android Auto running")
 
         else:
-            # Retry
-            if self._dhu_process and self._dhu_process.poll() is None:
-                print("[AA Manager] DHU window not found yet, retrying...")
-                QTimer.singleShot(1000, self._setup_seamless_capture)
-            else:
-                print("[AA Manager] DHU process ended")
-                self.error.emit("DHU closed unexpectedly")
+            # Keep waiting; _on_dhu_exited ends the wait if the DHU quits
+            logger.info("[AA Manager] DHU window not found yet, retrying...")
+            self._poll_for_dhu_window()
 
     @Slot()
     def _on_dhu_frame_ready(self):
@@ -921,7 +1471,7 @@ After installation, click "Launch Google DHU" button."""
     @Slot(str)
     def _on_dhu_capture_error(self, error_msg: str):
         """Handle capture errors."""
-        print(f"[AA Manager] Capture error: {error_msg}")
+        logger.warning("[AA Manager] Capture error: %s", error_msg)
         self.error.emit(error_msg)
 
     @Property(QObject, constant=True)
@@ -937,20 +1487,26 @@ After installation, click "Launch Google DHU" button."""
     @Slot()
     def closeDhu(self):
         """Close the embedded DHU."""
+        # Abort any pending wait for the head unit server or DHU window
+        self._adb_wait_cancelled.set()
+        self._stop_waiting_for_dhu_window()
+
         # Stop capture first
         self._dhu_capture.stopCapture()
 
         if self._dhu_process:
+            process = self._dhu_process
+            self._dhu_process = None
+            # This is an intentional exit - don't treat it as the DHU quitting
+            process.finished.disconnect(self._on_dhu_exited)
             try:
-                self._dhu_process.terminate()
-                self._dhu_process.wait(timeout=5)
+                process.terminate()
+                if not process.waitForFinished(5000):
+                    process.kill()
+                    process.waitForFinished(1000)
             except Exception as e:
-                print(f"[AA Manager] Error closing DHU: {e}")
-                try:
-                    self._dhu_process.kill()
-                except:
-                    pass
-            self._dhu_process = None
+                logger.error("[AA Manager] Error closing DHU: %s", e)
+            process.deleteLater()
 
         self._dhu_hwnd = 0
         self._dhu_embedded = False
@@ -959,7 +1515,7 @@ After installation, click "Launch Google DHU" button."""
     # Private methods
     def _set_state(self, state: str):
         """Update state and emit signal."""
-        if self._state != state:
+        if self._state is not state:
             self._state = state
             self.stateChanged.emit(state)
             logger.info(f"Android Auto state: {state}")
@@ -972,14 +1528,14 @@ After installation, click "Launch Google DHU" button."""
 
         if state == DeviceState.DISCONNECTED.value:
             self._set_state(AndroidAutoState.DISCONNECTED)
-            self.connectionProgress.emit("Waiting for Android device (USB)...")
+            self._report_progress("Waiting for Android device (USB)...")
         elif state == DeviceState.DETECTED.value:
             self._set_state(AndroidAutoState.CONNECTING)
-            self.connectionProgress.emit("Android device detected...")
+            self._report_progress("Android device detected...")
         elif state == DeviceState.AOAP_HANDSHAKE.value:
-            self.connectionProgress.emit("Switching to Android Auto mode...")
+            self._report_progress("Switching to Android Auto mode...")
         elif state == DeviceState.AOAP_MODE.value:
-            self.connectionProgress.emit("Setting up connection...")
+            self._report_progress("Setting up connection...")
 
     @Slot(str)
     def _on_tcp_state_changed(self, state: str):
@@ -989,20 +1545,19 @@ After installation, click "Launch Google DHU" button."""
 
         if state == TCPState.DISCONNECTED.value:
             self._set_state(AndroidAutoState.DISCONNECTED)
-            self.connectionProgress.emit("Disconnected from phone (TCP)")
+            self._report_progress("Disconnected from phone (TCP)")
         elif state == TCPState.CONNECTING.value:
             self._set_state(AndroidAutoState.CONNECTING)
-            self.connectionProgress.emit("Connecting to phone (TCP)...")
+            self._report_progress("Connecting to phone (TCP)...")
         elif state == TCPState.CONNECTED.value:
-            self.connectionProgress.emit("TCP connected, starting handshake...")
+            self._report_progress("TCP connected, starting handshake...")
 
     @Slot(object)
     def _on_device_connected(self, device):
         """Handle device connection."""
-        logger.info(f"Device connected: {device}")
-        print(f"[AA Manager] Device connected, starting protocol handshake...")
+        logger.info("[AA Manager] Device connected (%s), starting protocol handshake...", device)
         self._set_state(AndroidAutoState.SSL_HANDSHAKE)
-        self.connectionProgress.emit("Establishing secure connection...")
+        self._report_progress("Establishing secure connection...")
 
         # Start SSL handshake
         self._initiate_ssl_handshake()
@@ -1015,13 +1570,19 @@ After installation, click "Launch Google DHU" button."""
         self._services_discovered = False
         self._video_channel_open = False
         self._audio_channels_open.clear()
+        self._clear_audio_ring()
         self._set_state(AndroidAutoState.DISCONNECTED)
-        self.connectionProgress.emit("Device disconnected")
+        self._report_progress("Device disconnected")
 
     @Slot(bytes)
     def _on_data_received(self, data: bytes):
         """Handle incoming USB data."""
-        print(f"[AA Manager] Received {len(data)} bytes: {data.hex()}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            if _WIRE_DUMP:
+                logger.debug("[AA Manager] Received %s bytes: %s", len(data), data.hex())
+            else:
+                logger.debug("[AA Manager] Received %s bytes", len(data))
 
         # Try to detect version response directly using correct frame format:
         # Byte 0: Channel ID (0 for control)
@@ -1030,57 +1591,60 @@ After installation, click "Launch Google DHU" button."""
         # Bytes 4-5: Message ID (0x0002 = VERSION_RESPONSE)
         # Bytes 6+: Payload (version info)
         if len(data) >= 6:
-            channel_id = data[0]
-            flags = data[1]
-            frame_size = (data[2] << 8) | data[3]
-            msg_id = (data[4] << 8) | data[5]
+            if debug:
+                logger.debug("[AA Manager] Frame: channel=%s, flags=0x%02x, size=%s, msg_id=%s",
+                             *_FRAME_HDR.unpack_from(data))
 
-            print(f"[AA Manager] Frame: channel={channel_id}, flags=0x{flags:02x}, size={frame_size}, msg_id={msg_id}")
-
-            if channel_id == 0 and msg_id == ControlMessageType.VERSION_RESPONSE:
-                print(f"[AA Manager] Detected VERSION_RESPONSE!")
+            header = int.from_bytes(data[:6], 'big')
+            if header & _VER_RESP_HDR_MASK == _VER_RESP_HDR_VAL:
+                logger.info("[AA Manager] Detected VERSION_RESPONSE!")
                 # Parse version from payload (bytes 6-9)
                 if len(data) >= 10:
-                    import struct
-                    major = struct.unpack('>H', data[6:8])[0]
-                    minor = struct.unpack('>H', data[8:10])[0]
-                    print(f"[AA Manager] Phone AAP version: {major}.{minor}")
+                    major, minor = _VER_PAYLOAD.unpack_from(data, 6)
+                    logger.info("[AA Manager] Phone AAP version: %s.%s", major, minor)
                 self._handle_version_response_raw(data)
                 return
 
         # Parse frames and route messages
         messages = self._message_assembler.feed(data)
-        print(f"[AA Manager] Parsed {len(messages)} messages")
+        if debug:
+            logger.debug("[AA Manager] Parsed %s messages", len(messages))
 
         for message in messages:
-            print(f"[AA Manager] Message: channel={message.channel_id}, id={message.message_id}, payload_len={len(message.payload)}")
+            if debug:
+                logger.debug("[AA Manager] Message: channel=%s, id=%s, payload_len=%s",
+                             message.channel_id, message.message_id, len(message.payload))
 
             # Decrypt if necessary
             if message.encrypted and self._ssl_established:
                 # TODO: Implement SSL decryption
                 pass
 
-            self._message_router.route(message)
+            try:
+                self._message_router.route(message)
+            finally:
+                # Handlers are done with the payload - recycle its buffer
+                message.release()
 
     def _handle_version_response_raw(self, data: bytes):
         """Handle raw version response data."""
-        print(f"[AA Manager] Processing version response, proceeding with SSL handshake")
+        logger.info("[AA Manager] Processing version response, proceeding with SSL handshake")
 
         # Cancel the timeout timer since we got a response
-        if hasattr(self, '_version_response_timer') and self._version_response_timer:
+        if self._version_response_timer is not None:
             self._version_response_timer.stop()
             self._version_response_timer = None
 
-        self.connectionProgress.emit("Version exchange complete, starting SSL...")
+        self._report_progress("Version exchange complete, starting SSL...")
 
         # Initialize SSL handler
         if not self._ssl_handler.initialize():
-            print(f"[AA Manager] Failed to initialize SSL handler")
+            logger.warning("[AA Manager] Failed to initialize SSL handler")
             self.error.emit("Failed to initialize SSL")
             self._set_state(AndroidAutoState.ERROR)
             return
 
-        print(f"[AA Manager] SSL handler initialized, starting handshake")
+        logger.info("[AA Manager] SSL handler initialized, starting handshake")
         self._set_state(AndroidAutoState.SSL_HANDSHAKE)
 
         # Start SSL handshake - send initial ClientHello
@@ -1107,18 +1671,18 @@ After installation, click "Launch Google DHU" button."""
     @Slot()
     def _on_version_timeout(self):
         """Handle timeout waiting for version response."""
-        if self._state == AndroidAutoState.SSL_HANDSHAKE and not self._ssl_established:
-            print(f"[AA Manager] Timeout waiting for version response - phone may not be ready")
+        if self._state is AndroidAutoState.SSL_HANDSHAKE and not self._ssl_established:
+            logger.warning("[AA Manager] Timeout waiting for version response - phone may not be ready")
 
             if self._transport_mode == TransportMode.USB:
-                print(f"[AA Manager] Try: 1) Unplug and replug phone, or 2) Open Android Auto app on phone")
-                self.connectionProgress.emit("No response - try unplugging and replugging phone")
+                logger.warning("[AA Manager] Try: 1) Unplug and replug phone, or 2) Open Android Auto app on phone")
+                self._report_progress("No response - try unplugging and replugging phone")
                 self.error.emit("Phone not responding. Unplug and replug phone, or open Android Auto app.")
                 # Trigger disconnect to force retry
                 self._usb_transport._handle_stale_device()
             else:
-                print(f"[AA Manager] TCP: Phone not responding - check head unit server is running")
-                self.connectionProgress.emit("No response - check head unit server on phone")
+                logger.warning("[AA Manager] TCP: Phone not responding - check head unit server is running")
+                self._report_progress("No response - check head unit server on phone")
                 self.error.emit("Phone not responding. Start head unit server on phone.")
 
     def _send_version_request(self):
@@ -1128,57 +1692,72 @@ After installation, click "Launch Google DHU" button."""
         - Bytes 0-1: Major version (uint16 big-endian) = 1
         - Bytes 2-3: Minor version (uint16 big-endian) = 1
         """
-        import struct
+        logger.info("[AA Manager] Sending version request...")
 
-        print(f"[AA Manager] Sending version request...")
-
-        # aasdk uses version 1.1
-        AASDK_MAJOR = 1
-        AASDK_MINOR = 1
-
-        # Build version payload: major (uint16 BE) + minor (uint16 BE)
-        version_payload = struct.pack('>HH', AASDK_MAJOR, AASDK_MINOR)
-        print(f"[AA Manager] Version payload: {version_payload.hex()} (v{AASDK_MAJOR}.{AASDK_MINOR})")
-
-        message = Message(
-            channel_id=ChannelId.CONTROL,
-            message_id=ControlMessageType.VERSION_REQUEST,
-            payload=version_payload,
-            encrypted=False
-        )
+        # Version payload is invariant: major (uint16 BE) + minor (uint16 BE)
+        version_payload = _VERSION_REQUEST_PAYLOAD
+        logger.info("[AA Manager] Version payload: %s (v%s.%s)", version_payload.hex(), AASDK_MAJOR, AASDK_MINOR)
 
-        success = self._send_message(message)
-        print(f"[AA Manager] Version request sent: success={success}")
-        logger.debug("Sent version request")
+        success = self._send_frame_data(self._version_request_frame)
+        logger.info("[AA Manager] Version request sent: success=%s", success)
 
     def _send_message(self, message: Message) -> bool:
         """Send a message through the active transport."""
+        return self._send_frame_data(message.create_frame_data())
+
+    def _send_payload(self, channel_id: int, message_id: int, payload: bytes,
+                      encrypted: bool = False) -> bool:
+        """Send a message without allocating a Message for it."""
+        message = self._tx_message
+        message.channel_id = channel_id
+        message.message_id = message_id
+        message.payload = payload
+        message.encrypted = encrypted
+        try:
+            frame_data = message.create_frame_data()
+        finally:
+            # Don't keep the caller's payload (possibly a pooled view) alive
+            message.payload = b''
+        return self._send_frame_data(frame_data)
+
+    def _send_frame_data(self, frame_data: bytes) -> bool:
+        """Send already serialized frames through the active transport."""
+        if self._send_batch is not None:
+            # Coalescing: written together by _send_handshake_step
+            self._send_batch.append(frame_data)
+            return True
+
         if not self._active_transport:
-            print(f"[AA Manager] Cannot send: no active transport")
+            logger.warning("[AA Manager] Cannot send: no active transport")
             return False
 
-        frame_data = message.create_frame_data()
-        print(f"[AA Manager] Sending {len(frame_data)} bytes: {frame_data[:20].hex()}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            if _WIRE_DUMP:
+                logger.debug("[AA Manager] Sending %s bytes: %s...", len(frame_data), frame_data[:20].hex())
+            else:
+                logger.debug("[AA Manager] Sending %s bytes", len(frame_data))
         return self._active_transport.write(frame_data)
 
+    def _write_frames(self, frames: List[bytes]) -> bool:
+        """Send several serialized messages (or pieces of them) with one transport write."""
+        if len(frames) == 1:
+            return self._send_frame_data(frames[0])
+
+        if not self._active_transport:
+            logger.warning("[AA Manager] Cannot send: no active transport")
+            return False
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[AA Manager] Sending %s messages in one write", len(frames))
+        return self._active_transport.writev(frames)
+
     def _handle_control_message(self, message: Message):
         """Handle control channel messages."""
-        logger.debug(f"Control message received: ID={message.message_id}")
-
-        if message.message_id == ControlMessageType.VERSION_RESPONSE:
-            self._handle_version_response(message)
-        elif message.message_id == ControlMessageType.SSL_HANDSHAKE:
-            self._handle_ssl_data(message)
-        elif message.message_id == ControlMessageType.SERVICE_DISCOVERY_RESPONSE:
-            self._handle_service_discovery_response(message)
-        elif message.message_id == ControlMessageType.CHANNEL_OPEN_RESPONSE:
-            self._handle_channel_open_response(message)
-        elif message.message_id == ControlMessageType.PING_REQUEST:
-            self._handle_ping_request(message)
-        elif message.message_id == ControlMessageType.NAV_FOCUS_NOTIFICATION:
-            self._handle_nav_focus_notification(message)
-        elif message.message_id == ControlMessageType.AUDIO_FOCUS_REQUEST:
-            self._handle_audio_focus_request(message)
+        logger.debug("Control message received: ID=%s", message.message_id)
+
+        handler = self._control_handlers.get(message.message_id)
+        if handler:
+            handler(message)
 
     def _handle_version_response(self, message: Message):
         """Handle version response from phone."""
@@ -1193,98 +1772,107 @@ After installation, click "Launch Google DHU" button."""
             outgoing_data, complete = self._ssl_handler.process_handshake_data(b'')
 
             if outgoing_data:
-                print(f"[AA Manager] Sending SSL handshake data: {len(outgoing_data)} bytes")
-                # Send as SSL_HANDSHAKE message on control channel
-                message = Message(
-                    channel_id=ChannelId.CONTROL,
-                    message_id=ControlMessageType.SSL_HANDSHAKE,
-                    payload=outgoing_data,
-                    encrypted=False
-                )
-                self._send_message(message)
-
-            if complete:
-                self._on_ssl_handshake_complete()
+                logger.info("[AA Manager] Sending SSL handshake data: %s bytes", len(outgoing_data))
+            self._send_handshake_step(outgoing_data, complete)
 
         except Exception as e:
-            print(f"[AA Manager] SSL handshake error: {e}")
-            import traceback
+            logger.error("[AA Manager] SSL handshake error: %s", e)
             traceback.print_exc()
             self.error.emit(f"SSL handshake failed: {e}")
             self._set_state(AndroidAutoState.ERROR)
 
     def _handle_ssl_data(self, message: Message):
         """Handle SSL handshake data from phone."""
-        print(f"[AA Manager] Received SSL handshake data: {len(message.payload)} bytes")
+        logger.info("[AA Manager] Received SSL handshake data: %s bytes", len(message.payload))
 
         try:
             # Feed data to SSL handler and get response
             outgoing_data, complete = self._ssl_handler.process_handshake_data(message.payload)
 
             if outgoing_data:
-                print(f"[AA Manager] Sending SSL response: {len(outgoing_data)} bytes")
-                response = Message(
-                    channel_id=ChannelId.CONTROL,
-                    message_id=ControlMessageType.SSL_HANDSHAKE,
-                    payload=outgoing_data,
-                    encrypted=False
-                )
-                self._send_message(response)
-
-            if complete:
-                self._on_ssl_handshake_complete()
+                logger.info("[AA Manager] Sending SSL response: %s bytes", len(outgoing_data))
+            self._send_handshake_step(outgoing_data, complete)
 
         except Exception as e:
-            print(f"[AA Manager] SSL handshake error: {e}")
-            import traceback
+            logger.error("[AA Manager] SSL handshake error: %s", e)
             traceback.print_exc()
             self.error.emit(f"SSL handshake failed: {e}")
             self._set_state(AndroidAutoState.ERROR)
 
+    def _send_handshake_step(self, outgoing_data: bytes, complete: bool):
+        """
+        Send a handshake step's output as an SSL_HANDSHAKE message.
+
+        When the handshake completes, the final records, AUTH_COMPLETE and
+        the service discovery request go out in a single transport write.
+        """
+        self._send_batch = []
+        try:
+            if outgoing_data:
+                # Send as SSL_HANDSHAKE message on control channel
+                self._queue_handshake_records(outgoing_data)
+
+            if complete:
+                self._on_ssl_handshake_complete()
+        finally:
+            frames, self._send_batch = self._send_batch, None
+            if frames:
+                self._write_frames(frames)
+
+    def _queue_handshake_records(self, records: bytes):
+        """
+        Queue TLS records read from the SSL handler as an SSL_HANDSHAKE message.
+
+        A single-frame message is queued as its header plus the records
+        themselves, so they are only copied by the transport write.
+        """
+        size = len(records) + 2
+        if size > _MAX_FRAME_PAYLOAD:
+            self._send_payload(ChannelId.CONTROL, ControlMessageType.SSL_HANDSHAKE, records)
+            return
+
+        self._send_batch.append(_FRAME_HDR.pack(
+            ChannelId.CONTROL, FRAME_BULK, size, ControlMessageType.SSL_HANDSHAKE
+        ))
+        self._send_batch.append(records)
+
     def _on_ssl_handshake_complete(self):
         """Called when SSL handshake is complete."""
-        print(f"[AA Manager] SSL handshake complete!")
+        logger.info("[AA Manager] SSL handshake complete!")
         self._ssl_established = True
-        self.connectionProgress.emit("SSL handshake complete, authenticating...")
+        self._report_progress("SSL handshake complete, authenticating...")
 
         # Send AUTH_COMPLETE message
         self._send_auth_complete()
 
     def _send_auth_complete(self):
         """Send AUTH_COMPLETE to proceed with service discovery."""
-        print(f"[AA Manager] Sending AUTH_COMPLETE")
-        message = Message(
-            channel_id=ChannelId.CONTROL,
-            message_id=ControlMessageType.AUTH_COMPLETE,
-            payload=b'',  # Empty payload for auth complete
-            encrypted=False  # AUTH_COMPLETE is sent before encryption starts
-        )
-        success = self._send_message(message)
-        print(f"[AA Manager] AUTH_COMPLETE sent: success={success}")
+        logger.info("[AA Manager] Sending AUTH_COMPLETE")
+        # Empty payload, sent before encryption starts
+        success = self._send_frame_data(self._auth_complete_frame)
+        logger.info("[AA Manager] AUTH_COMPLETE sent: success=%s", success)
 
         # Now start service discovery
         self._set_state(AndroidAutoState.SERVICE_DISCOVERY)
-        self.connectionProgress.emit("Discovering services...")
+        self._report_progress("Discovering services...")
         self._send_service_discovery_request()
 
+    @staticmethod
+    def _build_service_descriptor(head_unit_info: HeadUnitInfo) -> bytes:
+        """Encode the service discovery request describing this head unit."""
+        if _ServiceDiscoveryRequest is None:
+            return b''  # Empty payload if proto not available
+
+        request = _ServiceDiscoveryRequest()
+        request.label_text = head_unit_info.make
+        request.device_name = head_unit_info.model
+        return request.SerializeToString()
+
     def _send_service_discovery_request(self):
         """Send service discovery request to phone."""
-        print(f"[AA Manager] Sending service discovery request")
+        logger.info("[AA Manager] Sending service discovery request")
 
-        try:
-            from .proto.aap_protobuf.service.control.message import ServiceDiscoveryRequest_pb2
-            request = ServiceDiscoveryRequest_pb2.ServiceDiscoveryRequest()
-            payload = request.SerializeToString()
-        except ImportError:
-            payload = b''  # Empty payload if proto not available
-
-        message = Message(
-            channel_id=ChannelId.CONTROL,
-            message_id=ControlMessageType.SERVICE_DISCOVERY_REQUEST,
-            payload=payload,
-            encrypted=self._ssl_established
-        )
-        self._send_message(message)
+        self._send_frame_data(self._service_discovery_frames[self._ssl_established])
 
     def _handle_service_discovery_response(self, message: Message):
         """Handle service discovery response."""
@@ -1293,8 +1881,9 @@ After installation, click "Launch Google DHU" button."""
 
         # Parse available services
         try:
-            from .proto.aap_protobuf.service.control.message import ServiceDiscoveryResponse_pb2
-            response = ServiceDiscoveryResponse_pb2.ServiceDiscoveryResponse()
+            if _ServiceDiscoveryResponse is None:
+                raise ImportError("protobuf messages not available")
+            response = _ServiceDiscoveryResponse()
             response.ParseFromString(message.payload)
             logger.info(f"Services available: {len(response.channels)}")
         except Exception as e:
@@ -1304,7 +1893,7 @@ After installation, click "Launch Google DHU" button."""
         self._request_channel_open(ChannelId.VIDEO)
 
         self._set_state(AndroidAutoState.CONNECTED)
-        self.connectionProgress.emit("Connected to Android Auto")
+        self._report_progress("Connected to Android Auto")
 
     def _handle_channel_open_response(self, message: Message):
         """Handle channel open response."""
@@ -1313,14 +1902,23 @@ After installation, click "Launch Google DHU" button."""
 
     def _handle_ping_request(self, message: Message):
         """Handle ping request and send response."""
-        # Send ping response
-        response = Message(
-            channel_id=ChannelId.CONTROL,
-            message_id=ControlMessageType.PING_RESPONSE,
-            payload=message.payload,
-            encrypted=message.encrypted
-        )
-        self._send_message(response)
+        payload = message.payload
+        size = len(payload) + 2
+        scratch = self._ping_resp_scratch
+
+        if self._send_batch is not None or size + 4 > len(scratch):
+            # Batched writes hold on to their data; large pings are unexpected
+            self._send_payload(ChannelId.CONTROL, ControlMessageType.PING_RESPONSE,
+                               payload, message.encrypted)
+            return
+
+        # Echo the payload under a PING_RESPONSE header; the transport write
+        # is synchronous, so the scratch buffer is free again afterwards
+        flags = FRAME_BULK | (ENC_ENCRYPTED if message.encrypted else 0)
+        _FRAME_HDR.pack_into(scratch, 0, ChannelId.CONTROL, flags, size,
+                             ControlMessageType.PING_RESPONSE)
+        scratch[6:size + 4] = payload
+        self._send_frame_data(memoryview(scratch)[:size + 4])
 
     def _handle_nav_focus_notification(self, message: Message):
         """Handle navigation focus notification."""
@@ -1334,18 +1932,22 @@ After installation, click "Launch Google DHU" button."""
     def _request_channel_open(self, channel_id: int):
         """Request to open a service channel."""
         try:
-            from .proto.aap_protobuf.service.control.message import ChannelOpenRequest_pb2
-            request = ChannelOpenRequest_pb2.ChannelOpenRequest()
-            # request.channel_id = channel_id
-            # request.priority = 0
+            # The request carries no per-channel fields yet, so its frame is
+            # built once per encryption state
+            frame_data = self._channel_open_frames.get(self._ssl_established)
+            if frame_data is None:
+                if _CHANNEL_OPEN_REQUEST_PAYLOAD is None:
+                    raise ImportError("protobuf messages not available")
+
+                frame_data = Message(
+                    channel_id=ChannelId.CONTROL,
+                    message_id=ControlMessageType.CHANNEL_OPEN_REQUEST,
+                    payload=_CHANNEL_OPEN_REQUEST_PAYLOAD,
+                    encrypted=self._ssl_established
+                ).create_frame_data()
+                self._channel_open_frames[self._ssl_established] = frame_data
 
-            message = Message(
-                channel_id=ChannelId.CONTROL,
-                message_id=ControlMessageType.CHANNEL_OPEN_REQUEST,
-                payload=request.SerializeToString(),
-                encrypted=self._ssl_established
-            )
-            self._send_message(message)
+            self._send_frame_data(frame_data)
             logger.debug(f"Requested channel open: {channel_id}")
 
         except Exception as e:
@@ -1353,17 +1955,69 @@ After installation, click "Launch Google DHU" button."""
 
     def _handle_video_data(self, message: Message):
         """Handle incoming video frame data."""
-        # This is H.264 encoded video data
-        self.videoFrameReady.emit(message.payload)
-
-        if self._state != AndroidAutoState.STREAMING:
+        # This is H.264 encoded video data. The payload may view a pooled
+        # buffer recycled after routing: the sink copies it before returning,
+        # signal receivers (possibly queued) get their own bytes.
+        payload = message.payload
+        if self._video_sink is not None:
+            self._video_sink(payload)
+        if self.isSignalConnected(QMetaMethod.fromSignal(self.videoFrameReady)):
+            self.videoFrameReady.emit(bytes(payload))
+
+        if self._state is not AndroidAutoState.STREAMING:
             self._set_state(AndroidAutoState.STREAMING)
 
     def _handle_audio_data(self, message: Message):
-        """Handle incoming audio data."""
-        # This is PCM audio data
-        stream_type = message.channel_id
-        self.audioDataReady.emit(message.payload, stream_type)
+        """Queue incoming audio data for the next batched emission."""
+        # This is PCM audio data; keep a pooled payload alive until emitted
+        buffer = message.buffer.retain() if message.buffer else None
+
+        ring = self._audio_ring
+        if len(ring) >= self._audio_ring_capacity:
+            _, _, dropped = ring.popleft()
+            if dropped:
+                dropped.release()
+
+        ring.append((message.payload, message.channel_id, buffer))
+
+        # Arm one drain when the ring goes from empty to non-empty
+        if len(ring) == 1:
+            QTimer.singleShot(0, self._drain_audio_ring)
+
+    @Slot()
+    def _drain_audio_ring(self):
+        """Emit all queued audio packets as one batch."""
+        ring = self._audio_ring
+        packets = []
+        buffers = []
+        while ring:
+            payload, stream_type, buffer = ring.popleft()
+            # Copy out of the pooled buffer: receivers may hold the packet
+            # (or get it queued) after the buffer is recycled below
+            packets.append((bytes(payload), stream_type))
+            if buffer:
+                buffers.append(buffer)
+
+        if not packets:
+            return
+
+        try:
+            self.audioBatchReady.emit(packets)
+
+            # Per-packet signal for consumers that haven't moved to batches
+            if self.isSignalConnected(QMetaMethod.fromSignal(self.audioDataReady)):
+                for payload, stream_type in packets:
+                    self.audioDataReady.emit(payload, stream_type)
+        finally:
+            for buffer in buffers:
+                buffer.release()
+
+    def _clear_audio_ring(self):
+        """Drop queued audio packets and return their buffers."""
+        while self._audio_ring:
+            _, _, buffer = self._audio_ring.popleft()
+            if buffer:
+                buffer.release()
 
     def _handle_navigation_data(self, message: Message):
         """Handle navigation status updates."""
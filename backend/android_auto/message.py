@@ -11,10 +11,10 @@ Frame format (based on aasdk):
 - OR Bytes 2-7: Frame size (uint16) + Total size (uint32) - EXTENDED format
 """
 
+import os
 import struct
 import logging
-from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Iterable, Union
 from enum import IntEnum
 
 from .constants import (
@@ -23,12 +23,33 @@ from .constants import (
     EncryptionType,
     ChannelId,
     MessageType,
+    decode_flags,
+    MSG_SPECIFIC,
+    MSG_CONTROL,
+    ENC_PLAIN,
+    FRAME_MIDDLE,
+    FRAME_FIRST,
+    FRAME_LAST,
+    FRAME_BULK,
+    ENC_ENCRYPTED,
 )
+from .buffer_pool import FramePool, PooledBuffer
 
 logger = logging.getLogger(__name__)
 
+# Per-frame header logging is a trace of every audio/video frame, so it is
+# only produced with OCTAVE_WIRE_DUMP=1 (like the manager's hex dumps), on
+# top of debug logging
+_TRACE_FRAMES = os.environ.get("OCTAVE_WIRE_DUMP") == "1"
+
+# Precompiled layouts: channel, flags, frame size (+ total size for the
+# EXTENDED format), and the message id / total size fields on their own
+_HDR_SHORT = struct.Struct('>BBH')
+_HDR_EXT = struct.Struct('>BBHI')
+_U16 = struct.Struct('>H')
+_U32 = struct.Struct('>I')
+
 
-@dataclass
 class FrameHeader:
     """
     AAP Frame Header.
@@ -38,53 +59,85 @@ class FrameHeader:
     - Byte 1: Flags = FrameType (bits 0-1) | MessageType (bit 2) | EncryptionType (bit 3)
     - Bytes 2+: Frame size (2 or 6 bytes depending on format)
     """
-    channel_id: int
-    frame_type: FrameType
-    encryption_type: EncryptionType
-    message_type: MessageType
-    frame_size: int
-    total_size: Optional[int] = None  # Only for EXTENDED format
+
+    __slots__ = ('channel_id', 'frame_type', 'encryption_type', 'message_type',
+                 'frame_size', 'total_size', '_flags')
+
+    def __init__(self, channel_id: int, frame_type: FrameType, encryption_type: EncryptionType,
+                 message_type: MessageType, frame_size: int, total_size: Optional[int] = None):
+        self.channel_id = channel_id
+        self.frame_type = frame_type
+        self.encryption_type = encryption_type
+        self.message_type = message_type
+        self.frame_size = frame_size
+        self.total_size = total_size  # Only for EXTENDED format
+        # Flags byte, built once from the type fields (which aren't
+        # reassigned). Each field's value is its own bit pattern, so masking
+        # needs no enum comparisons.
+        self._flags = (
+            (frame_type & 0x03) |
+            (message_type & MSG_CONTROL) |
+            (encryption_type & ENC_ENCRYPTED)
+        )
+
+    def __repr__(self) -> str:
+        return (f"FrameHeader(channel_id={self.channel_id!r}, frame_type={self.frame_type!r}, "
+                f"encryption_type={self.encryption_type!r}, message_type={self.message_type!r}, "
+                f"frame_size={self.frame_size!r}, total_size={self.total_size!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.channel_id, self.frame_type, self.encryption_type,
+             self.message_type, self.frame_size, self.total_size) ==
+            (other.channel_id, other.frame_type, other.encryption_type,
+             other.message_type, other.frame_size, other.total_size)
+        )
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Tuple['FrameHeader', int]:
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Tuple['FrameHeader', int]:
         """
         Parse a frame header from bytes.
 
+        Args:
+            data: Buffer holding the header
+            offset: Position of the header in data
+
         Returns:
             Tuple of (FrameHeader, bytes_consumed)
         """
-        if len(data) < 4:  # Minimum: 2 header + 2 size
+        available = len(data) - offset
+        if available < 4:  # Minimum: 2 header + 2 size
             raise ValueError("Not enough data for frame header")
 
-        channel_id = data[0]
-        flags = data[1]
+        channel_id, flags, frame_size = _HDR_SHORT.unpack_from(data, offset)
 
         # Parse flags byte
         # FrameType: bits 0-1 (mask 0x03)
         # MessageType: bit 2 (mask 0x04)
         # EncryptionType: bit 3 (mask 0x08)
-        frame_type = FrameType(flags & 0x03)
-        message_type = MessageType.CONTROL if (flags & 0x04) else MessageType.SPECIFIC
-        encryption_type = EncryptionType.ENCRYPTED if (flags & 0x08) else EncryptionType.PLAIN
+        frame_type, message_type, encryption_type = decode_flags(flags)
 
-        # Parse frame size (always big-endian uint16)
-        frame_size = struct.unpack('>H', data[2:4])[0]
         bytes_consumed = 4
         total_size = None
 
         # EXTENDED format is ONLY used for multi-frame messages (FIRST frame type)
         # BULK frames (single-frame) NEVER use extended format
         # Only check for extended format if this is a FIRST frame
-        if frame_type == FrameType.FIRST and len(data) >= 8:
+        if frame_type == FRAME_FIRST and available >= 8:
             # In extended format, bytes 4-7 contain total_size as uint32
-            potential_total = struct.unpack('>I', data[4:8])[0]
+            potential_total = _U32.unpack_from(data, offset + 4)[0]
             # total_size should be >= frame_size (it's the total across all frames)
             if potential_total >= frame_size:
                 total_size = potential_total
                 bytes_consumed = 8
 
-        print(f"[AA Frame] Raw: {data[:8].hex() if len(data) >= 8 else data.hex()}")
-        print(f"[AA Frame] channel={channel_id}, flags=0x{flags:02x}, frame_type={frame_type.name}, msg_type={message_type}, enc={encryption_type.name}, frame_size={frame_size}, header_bytes={bytes_consumed}")
+        if _TRACE_FRAMES and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[AA Frame] channel=%s, flags=0x%02x, frame_type=%s, msg_type=%s, enc=%s, frame_size=%s, header_bytes=%s",
+                channel_id, flags, frame_type.name, message_type, encryption_type.name, frame_size, bytes_consumed
+            )
 
         return cls(
             channel_id=channel_id,
@@ -97,23 +150,10 @@ class FrameHeader:
 
     def to_bytes(self) -> bytes:
         """Serialize frame header to bytes."""
-        # Build flags byte
-        flags = (
-            (self.frame_type & 0x03) |
-            (0x04 if self.message_type == MessageType.CONTROL else 0) |
-            (0x08 if self.encryption_type == EncryptionType.ENCRYPTED else 0)
-        )
-
-        header = bytes([self.channel_id, flags])
-
-        # Add frame size (always 2 bytes, big-endian)
-        header += struct.pack('>H', self.frame_size)
-
-        # Add total size if extended format
-        if self.total_size is not None:
-            header += struct.pack('>I', self.total_size)
-
-        return header
+        # Frame size is always 2 bytes; total size only in extended format
+        if self.total_size is None:
+            return _HDR_SHORT.pack(self.channel_id, self._flags, self.frame_size)
+        return _HDR_EXT.pack(self.channel_id, self._flags, self.frame_size, self.total_size)
 
     @staticmethod
     def size_of(extended: bool = False) -> int:
@@ -121,7 +161,6 @@ class FrameHeader:
         return 8 if extended else 4
 
 
-@dataclass
 class Message:
     """
     AAP Message.
@@ -130,21 +169,85 @@ class Message:
     - Message ID (2 bytes, big-endian)
     - Payload (protobuf data)
     """
-    channel_id: int
-    message_id: int
-    payload: bytes
-    encrypted: bool = False
+
+    __slots__ = ('channel_id', 'message_id', 'payload', 'encrypted', 'buffer')
+
+    def __init__(self, channel_id: int, message_id: int, payload: Union[bytes, memoryview],
+                 encrypted: bool = False, buffer: Optional[PooledBuffer] = None):
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.payload = payload
+        self.encrypted = encrypted
+        # Pool buffer backing the payload, if it was assembled into one
+        self.buffer = buffer
+
+    def __repr__(self) -> str:
+        return (f"Message(channel_id={self.channel_id!r}, message_id={self.message_id!r}, "
+                f"payload={self.payload!r}, encrypted={self.encrypted!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.channel_id, self.message_id, self.payload, self.encrypted) ==
+            (other.channel_id, other.message_id, other.payload, other.encrypted)
+        )
+
+    def release(self):
+        """Return the pooled payload buffer, if any; payload is invalid afterwards."""
+        if self.buffer is not None:
+            self.buffer.release()
+            self.buffer = None
+
+    @classmethod
+    def from_pooled_frames(cls, channel_id: int, frames: List[bytes], pool: FramePool,
+                           encrypted: bool = False) -> 'Message':
+        """
+        Assemble a message from frames into a pooled buffer.
+
+        The payload is a memoryview into the buffer and is only valid
+        until release() is called.
+        """
+        size = sum(len(frame) for frame in frames)
+
+        if size < 2:
+            raise ValueError("Message too short")
+
+        buffer = pool.acquire(size)
+        view = buffer.view
+        offset = 0
+        for frame in frames:
+            end = offset + len(frame)
+            view[offset:end] = frame
+            offset = end
+
+        return cls(
+            channel_id=channel_id,
+            message_id=(view[0] << 8) | view[1],
+            payload=view[2:],
+            encrypted=encrypted,
+            buffer=buffer
+        )
 
     @classmethod
     def from_frames(cls, channel_id: int, frames: List[bytes], encrypted: bool = False) -> 'Message':
-        """Assemble a message from one or more frames."""
-        data = b''.join(frames)
+        """
+        Assemble a message from one or more frames.
+
+        A multi-frame payload is a memoryview over the joined frames, so
+        the message id is not stripped with another copy.
+        """
+        if len(frames) == 1:
+            data = frames[0]
+            payload = data[2:]
+        else:
+            data = b''.join(frames)
+            payload = memoryview(data)[2:]
 
         if len(data) < 2:
             raise ValueError("Message too short")
 
-        message_id = struct.unpack('>H', data[:2])[0]
-        payload = data[2:]
+        message_id = (data[0] << 8) | data[1]
 
         return cls(
             channel_id=channel_id,
@@ -163,7 +266,7 @@ class Message:
         Returns:
             List of frame payloads (without headers)
         """
-        data = struct.pack('>H', self.message_id) + self.payload
+        data = _U16.pack(self.message_id) + self.payload
 
         if len(data) <= max_frame_size:
             return [data]
@@ -174,49 +277,108 @@ class Message:
 
         return frames
 
-    def create_frame_data(self, max_frame_size: int = 16384) -> bytes:
+    def create_frame_data(self, max_frame_size: int = 16384) -> bytearray:
         """
         Create complete frame data (header + payload) for transmission.
 
         Returns:
-            Bytes ready to send over USB
+            Bytes ready to send over USB, written into one buffer
         """
         frames = self.to_frames(max_frame_size)
-        result = b''
         total_size = sum(len(f) for f in frames)
 
+        # 4-byte headers, plus the total size in the first of several frames
+        extended_overhead = 4 if len(frames) > 1 else 0
+        result = bytearray(total_size + 4 * len(frames) + extended_overhead)
+        offset = 0
+
+        channel_id = self.channel_id
+        # Channel-specific message type; only the frame type varies per frame
+        flags_base = MSG_SPECIFIC | (ENC_ENCRYPTED if self.encrypted else ENC_PLAIN)
+        last = len(frames) - 1
+
         for i, frame_payload in enumerate(frames):
-            # Determine frame type
-            is_first = (i == 0)
-            is_last = (i == len(frames) - 1)
-
-            if is_first and is_last:
-                frame_type = FrameType.BULK  # FIRST_AND_LAST = BULK in aasdk
-            elif is_first:
-                frame_type = FrameType.FIRST
-            elif is_last:
-                frame_type = FrameType.LAST
+            frame_size = len(frame_payload)
+
+            if last == 0:
+                # FIRST_AND_LAST = BULK in aasdk
+                _HDR_SHORT.pack_into(result, offset, channel_id, flags_base | FRAME_BULK, frame_size)
+                offset += 4
+            elif i == 0:
+                # Use EXTENDED format only for the first frame of a multi-frame message
+                _HDR_EXT.pack_into(result, offset, channel_id, flags_base | FRAME_FIRST, frame_size, total_size)
+                offset += 8
             else:
-                frame_type = FrameType.MIDDLE
-
-            # Create header
-            # Use EXTENDED format only for multi-frame messages
-            use_extended = len(frames) > 1 and is_first
-
-            header = FrameHeader(
-                channel_id=self.channel_id,
-                frame_type=frame_type,
-                encryption_type=EncryptionType.ENCRYPTED if self.encrypted else EncryptionType.PLAIN,
-                message_type=MessageType.SPECIFIC,
-                frame_size=len(frame_payload),
-                total_size=total_size if use_extended else None
-            )
+                frame_type = FRAME_LAST if i == last else FRAME_MIDDLE
+                _HDR_SHORT.pack_into(result, offset, channel_id, flags_base | frame_type, frame_size)
+                offset += 4
 
-            result += header.to_bytes() + frame_payload
+            end = offset + frame_size
+            result[offset:end] = frame_payload
+            offset = end
 
         return result
 
 
+# Consumed bytes are dropped from the front of the assembler buffer once
+# there are at least this many and they make up most of the buffer
+_COMPACT_THRESHOLD = 65536
+
+
+class _PartialMessage:
+    """
+    A multi-frame message being assembled in place.
+
+    When the FIRST frame announces the total size, the message is copied
+    into one buffer of that size (from the pool on pooled channels);
+    otherwise it collects into a growing bytearray.
+    """
+
+    __slots__ = ('data', 'length', 'buffer')
+
+    def __init__(self, total_size: Optional[int], pool: Optional[FramePool]):
+        self.length = 0
+        self.buffer: Optional[PooledBuffer] = None
+        if total_size is None:
+            self.data = bytearray()
+        elif pool is not None:
+            self.buffer = pool.acquire(total_size)
+            self.data = self.buffer.view
+        else:
+            self.data = bytearray(total_size)
+
+    def append(self, frame: memoryview):
+        """Copy the next frame's payload after the data received so far."""
+        start = self.length
+        end = start + len(frame)
+        if self.buffer is not None and end > len(self.data):
+            raise ValueError("Frames exceed the announced message size")
+        # A bytearray grows if the frames exceed its size
+        self.data[start:end] = frame
+        self.length = end
+
+    def release(self):
+        """Return the pooled buffer of an abandoned message, if any."""
+        if self.buffer is not None:
+            self.buffer.release()
+            self.buffer = None
+
+    def to_message(self, channel_id: int, encrypted: bool) -> Message:
+        """Build the completed message; its payload is a view into the data."""
+        if self.length < 2:
+            self.release()
+            raise ValueError("Message too short")
+
+        data = self.data
+        return Message(
+            channel_id=channel_id,
+            message_id=(data[0] << 8) | data[1],
+            payload=memoryview(data)[2:self.length],
+            encrypted=encrypted,
+            buffer=self.buffer
+        )
+
+
 class MessageAssembler:
     """
     Assembles complete messages from incoming frame data.
@@ -224,94 +386,169 @@ class MessageAssembler:
     Handles multi-frame messages and buffering of incomplete data.
     """
 
-    def __init__(self):
-        self._buffer = b''
-        self._current_frames: dict[int, List[bytes]] = {}  # channel_id -> frames
+    __slots__ = ('_buffer', '_read_pos', '_current_frames', '_frame_pool', '_pooled_channels')
+
+    def __init__(self, frame_pool: Optional[FramePool] = None, pooled_channels: Iterable[int] = ()):
+        """
+        Args:
+            frame_pool: Pool to assemble multi-frame messages into
+            pooled_channels: Channels whose multi-frame messages use the pool;
+                their payloads must be released by the caller after use
+        """
+        # Received bytes; frames are parsed in place starting at _read_pos
+        self._buffer = bytearray()
+        self._read_pos = 0
+        self._current_frames: dict[int, _PartialMessage] = {}  # channel_id -> partial message
+        self._frame_pool = frame_pool
+        self._pooled_channels = frozenset(pooled_channels) if frame_pool else frozenset()
 
     def feed(self, data: bytes) -> List[Message]:
         """
         Feed incoming data and return any complete messages.
 
+        Frames are parsed in one loop over the buffer, with headers read
+        straight from it; Message objects are only built for complete
+        messages. When no partial frame is carried over from the previous
+        call, the data is parsed in place and only its unparsed tail is
+        buffered.
+
         Args:
             data: Incoming bytes from USB
 
         Returns:
             List of complete Message objects
         """
-        self._buffer += data
+        buffer = self._buffer
+        if buffer:
+            buffer += data
+            source = buffer
+        else:
+            source = data
         messages = []
 
-        while True:
-            try:
-                msg = self._try_extract_message()
-                if msg:
-                    messages.append(msg)
-                else:
-                    break
-            except ValueError as e:
-                logger.warning(f"Error parsing frame: {e}")
-                # Skip a byte and try again
-                self._buffer = self._buffer[1:]
-                if not self._buffer:
+        pos = self._read_pos
+        size = len(source)
+        unpack_header = _HDR_SHORT.unpack_from
+        unpack_u32 = _U32.unpack_from
+        current_frames = self._current_frames
+        debug = _TRACE_FRAMES and logger.isEnabledFor(logging.DEBUG)
+
+        # Frame payloads are copied out of the source exactly once (into the
+        # message or its partial buffer); views into it can't be kept, since
+        # it is appended to and compacted. The view is released before the
+        # buffer grows again.
+        with memoryview(source) as view:
+            while size - pos >= 4:  # Minimum header size
+                # Byte 0: channel, byte 1: flags, bytes 2-3: frame size
+                channel_id, flags, frame_size = unpack_header(source, pos)
+                frame_type = flags & 0x03
+
+                if frame_type == FRAME_BULK and frame_size >= 2:
+                    # Fast path for single-frame messages (FIRST_AND_LAST),
+                    # most of the traffic: always a short header, no
+                    # multi-frame state; copy just the payload after the
+                    # message id
+                    frame_start = pos + 4
+                    end = frame_start + frame_size
+                    if end > size:
+                        break
+                    pos = end
+
+                    if debug:
+                        logger.debug("[AA Frame] channel=%s, flags=0x%02x, frame_size=%s, header_bytes=4",
+                                     channel_id, flags, frame_size)
+                    messages.append(Message(
+                        channel_id,
+                        (source[frame_start] << 8) | source[frame_start + 1],
+                        bytes(view[frame_start + 2:end]),
+                        (flags & ENC_ENCRYPTED) != 0
+                    ))
+                    continue
+
+                header_size = 4
+                total_size = None
+
+                # EXTENDED format is ONLY used for multi-frame messages (FIRST
+                # frame type); bytes 4-7 then hold the message's total size,
+                # which is never smaller than the frame size
+                if frame_type == FRAME_FIRST and size - pos >= 8:
+                    total_size = unpack_u32(source, pos + 4)[0]
+                    if total_size >= frame_size:
+                        header_size = 8
+                    else:
+                        total_size = None
+
+                frame_start = pos + header_size
+                end = frame_start + frame_size
+                if end > size:
                     break
+                pos = end
+
+                encrypted = (flags & ENC_ENCRYPTED) != 0
+                if debug:
+                    logger.debug(
+                        "[AA Frame] channel=%s, flags=0x%02x, frame_size=%s, header_bytes=%s",
+                        channel_id, flags, frame_size, header_size
+                    )
+
+                try:
+                    if frame_type == FRAME_BULK:
+                        # Single frame message too short for a message id
+                        raise ValueError("Message too short")
+
+                    elif frame_type == FRAME_FIRST:
+                        # Start of multi-frame message
+                        partial = current_frames.pop(channel_id, None)
+                        if partial is not None:
+                            partial.release()
+                        partial = _PartialMessage(
+                            total_size,
+                            self._frame_pool if channel_id in self._pooled_channels else None
+                        )
+                        current_frames[channel_id] = partial
+                        partial.append(view[frame_start:end])
+
+                    elif frame_type == FRAME_MIDDLE:
+                        # Middle of multi-frame message
+                        partial = current_frames.get(channel_id)
+                        if partial is not None:
+                            try:
+                                partial.append(view[frame_start:end])
+                            except ValueError:
+                                del current_frames[channel_id]
+                                partial.release()
+                                raise
+
+                    else:
+                        # End of multi-frame message
+                        partial = current_frames.pop(channel_id, None)
+                        if partial is not None:
+                            try:
+                                partial.append(view[frame_start:end])
+                            except ValueError:
+                                partial.release()
+                                raise
+                            messages.append(partial.to_message(channel_id, encrypted))
+                except ValueError as e:
+                    logger.warning(f"Error parsing frame: {e}")
+                    # Skip a byte and try again
+                    pos += 1
+
+        if source is not buffer:
+            # Keep only the incomplete frame at the end of the chunk
+            if pos < size:
+                buffer += data[pos:]
+            pos = 0
+        elif pos >= size:
+            buffer.clear()
+            pos = 0
+        elif pos > _COMPACT_THRESHOLD and pos * 2 > size:
+            del buffer[:pos]
+            pos = 0
+        self._read_pos = pos
 
         return messages
 
-    def _try_extract_message(self) -> Optional[Message]:
-        """Try to extract a complete message from the buffer."""
-        if len(self._buffer) < 4:  # Minimum header size
-            return None
-
-        try:
-            header, header_size = FrameHeader.from_bytes(self._buffer)
-        except ValueError:
-            return None
-
-        total_frame_size = header_size + header.frame_size
-
-        if len(self._buffer) < total_frame_size:
-            return None
-
-        # Extract frame payload
-        payload = self._buffer[header_size:total_frame_size]
-        self._buffer = self._buffer[total_frame_size:]
-
-        channel_id = header.channel_id
-
-        # Handle multi-frame messages
-        if header.frame_type == FrameType.BULK:
-            # Single frame message (FIRST_AND_LAST)
-            return Message.from_frames(
-                channel_id,
-                [payload],
-                encrypted=(header.encryption_type == EncryptionType.ENCRYPTED)
-            )
-
-        elif header.frame_type == FrameType.FIRST:
-            # Start of multi-frame message
-            self._current_frames[channel_id] = [payload]
-            return None
-
-        elif header.frame_type == FrameType.MIDDLE:
-            # Middle of multi-frame message
-            if channel_id in self._current_frames:
-                self._current_frames[channel_id].append(payload)
-            return None
-
-        elif header.frame_type == FrameType.LAST:
-            # End of multi-frame message
-            if channel_id in self._current_frames:
-                frames = self._current_frames.pop(channel_id)
-                frames.append(payload)
-                return Message.from_frames(
-                    channel_id,
-                    frames,
-                    encrypted=(header.encryption_type == EncryptionType.ENCRYPTED)
-                )
-            return None
-
-        return None
-
 
 class MessageRouter:
     """
@@ -319,23 +556,25 @@ class MessageRouter:
     """
 
     def __init__(self):
-        self._handlers: dict[int, callable] = {}
+        # Dense lookup table indexed by the channel id byte, so routing is a
+        # list index instead of a dict lookup hashing the IntEnum key
+        self._handlers: List[Optional[callable]] = [None] * 256
 
     def register_handler(self, channel_id: int, handler: callable):
         """Register a handler for a specific channel."""
-        self._handlers[channel_id] = handler
+        self._handlers[int(channel_id)] = handler
 
     def unregister_handler(self, channel_id: int):
         """Unregister a channel handler."""
-        self._handlers.pop(channel_id, None)
+        self._handlers[int(channel_id)] = None
 
     def route(self, message: Message):
         """Route a message to its handler."""
-        handler = self._handlers.get(message.channel_id)
+        handler = self._handlers[message.channel_id]
         if handler:
             try:
                 handler(message)
             except Exception as e:
                 logger.error(f"Error handling message on channel {message.channel_id}: {e}")
         else:
-            logger.debug(f"No handler for channel {message.channel_id}, message ID {message.message_id}")
+            logger.debug("No handler for channel %s, message ID %s", message.channel_id, message.message_id)
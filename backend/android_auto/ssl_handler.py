@@ -12,7 +12,8 @@ and performs mutual authentication with the phone.
 import ssl
 import os
 import logging
-from typing import Optional, Tuple, Callable
+import threading
+from typing import Optional, Tuple, Callable, Union, Dict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -26,6 +27,14 @@ import datetime
 
 logger = logging.getLogger(__name__)
 
+# Any buffer MemoryBIO.write can take without a copy into a bytes object first
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Configured SSL contexts shared by all handlers, keyed by
+# (as_server, cert_path, key_path). A context holds no per-connection state.
+_SHARED_CONTEXTS: Dict[Tuple[bool, str, str], ssl.SSLContext] = {}
+_SHARED_CONTEXTS_LOCK = threading.Lock()
+
 # JVC Kenwood certificate signed by Google Automotive Link CA
 # This certificate is trusted by Android Auto and used by aasdk/OpenAuto
 AASDK_CERTIFICATE = """-----BEGIN CERTIFICATE-----
@@ -99,6 +108,8 @@ class SSLHandler:
     def __init__(self, config: Optional[SSLConfig] = None):
         self._config = config or SSLConfig()
         self._ssl_context: Optional[ssl.SSLContext] = None
+        # Role the context was configured for; it is reused across connections
+        self._context_as_server: Optional[bool] = None
         self._ssl_object: Optional[ssl.SSLObject] = None
 
         # Handshake state
@@ -108,6 +119,12 @@ class SSLHandler:
 
         # Certificate paths
         self._cert_dir = Path(__file__).parent / "certs"
+        # SHA256 fingerprint of the certificate at cert_path, once computed
+        self._cert_fingerprint: Optional[str] = None
+
+        # Scratch buffer decrypted records are read into (one TLS record max)
+        self._decrypt_buf = bytearray(16384)
+        self._decrypt_view = memoryview(self._decrypt_buf)
 
     def initialize(self, as_server: bool = False) -> bool:
         """
@@ -121,16 +138,22 @@ class SSLHandler:
             True if initialization successful
         """
         try:
-            # Ensure cert directory exists
-            self._cert_dir.mkdir(parents=True, exist_ok=True)
+            # The context holds no per-connection state, so certificates are
+            # only loaded and the context built on first use
+            if self._ssl_context is None or self._context_as_server != as_server:
+                # Ensure cert directory exists
+                self._cert_dir.mkdir(parents=True, exist_ok=True)
+
+                # Generate or load certificates
+                if not self._load_certificates():
+                    if not self._generate_certificates():
+                        return False
 
-            # Generate or load certificates
-            if not self._load_certificates():
-                if not self._generate_certificates():
-                    return False
+                # Create SSL context
+                self._create_ssl_context(as_server)
+                self._context_as_server = as_server
 
-            # Create SSL context
-            self._create_ssl_context(as_server)
+            self._handshake_complete = False
 
             # Create memory BIOs for handshake
             self._incoming_bio = ssl.MemoryBIO()
@@ -172,6 +195,7 @@ class SSLHandler:
 
         self._config.cert_path = cert_file
         self._config.key_path = key_file
+        self._cert_fingerprint = None
         logger.info("Loaded aasdk certificates (JVC Kenwood / Google Automotive Link)")
         return True
 
@@ -229,6 +253,11 @@ class SSLHandler:
 
             self._config.cert_path = cert_file
             self._config.key_path = key_file
+            self._cert_fingerprint = self._format_fingerprint(cert)
+
+            # Contexts loaded from the replaced files are stale
+            with _SHARED_CONTEXTS_LOCK:
+                _SHARED_CONTEXTS.clear()
 
             logger.info("Generated and saved head unit certificates")
             return True
@@ -238,42 +267,58 @@ class SSLHandler:
             return False
 
     def _create_ssl_context(self, as_server: bool = False):
+        """Get the shared SSL context for this role and certificate, creating it if needed."""
+        key = (as_server, str(self._config.cert_path or ""), str(self._config.key_path or ""))
+
+        with _SHARED_CONTEXTS_LOCK:
+            context = _SHARED_CONTEXTS.get(key)
+            if context is None:
+                context = self._build_ssl_context(as_server)
+                _SHARED_CONTEXTS[key] = context
+
+        self._ssl_context = context
+
+    def _build_ssl_context(self, as_server: bool) -> ssl.SSLContext:
         """Create and configure SSL context."""
         if as_server:
-            self._ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
         else:
-            self._ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
 
         # Load certificate and key
         if self._config.cert_path and self._config.key_path:
-            self._ssl_context.load_cert_chain(
+            context.load_cert_chain(
                 certfile=str(self._config.cert_path),
                 keyfile=str(self._config.key_path)
             )
 
         # Configure for Android Auto compatibility
-        self._ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-        self._ssl_context.maximum_version = ssl.TLSVersion.TLSv1_2
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+        context.maximum_version = ssl.TLSVersion.TLSv1_2
 
         # Don't verify certificates (Android Auto uses custom auth)
-        self._ssl_context.check_hostname = False
-        self._ssl_context.verify_mode = ssl.CERT_NONE
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
 
         # Set cipher suites compatible with Android Auto
         try:
-            self._ssl_context.set_ciphers(
+            context.set_ciphers(
                 "ECDHE+AESGCM:DHE+AESGCM:ECDHE+CHACHA20:DHE+CHACHA20:RSA+AESGCM:RSA+AES"
             )
         except ssl.SSLError:
             # Fallback to default ciphers if specific ones aren't available
             pass
 
-    def process_handshake_data(self, data: bytes) -> Tuple[bytes, bool]:
+        return context
+
+    def process_handshake_data(self, data: BytesLike) -> Tuple[bytes, bool]:
         """
         Process incoming SSL handshake data.
 
         Args:
-            data: Incoming handshake data from phone (can be empty to initiate)
+            data: Incoming handshake data from phone (can be empty to initiate).
+                  Any bytes-like object; it is copied straight into the BIO,
+                  so a view into a pooled message buffer needs no copy first.
 
         Returns:
             Tuple of (outgoing data to send, handshake complete flag)
@@ -284,32 +329,29 @@ class SSLHandler:
         # Write incoming data to BIO (if any)
         if data:
             self._incoming_bio.write(data)
-            print(f"[SSL] Fed {len(data)} bytes to incoming BIO")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SSL] Fed %s bytes to incoming BIO", len(data))
 
         try:
             # Try to complete handshake
             self._ssl_object.do_handshake()
             self._handshake_complete = True
             logger.info("SSL handshake complete")
-            print(f"[SSL] Handshake complete!")
 
         except ssl.SSLWantReadError:
             # Need more data - this is normal during handshake
-            print(f"[SSL] Handshake wants more data (SSLWantReadError)")
-            pass
+            logger.debug("[SSL] Handshake wants more data (SSLWantReadError)")
         except ssl.SSLWantWriteError:
             # Need to write data - this is normal during handshake
-            print(f"[SSL] Handshake wants to write (SSLWantWriteError)")
-            pass
+            logger.debug("[SSL] Handshake wants to write (SSLWantWriteError)")
         except ssl.SSLError as e:
-            print(f"[SSL] Handshake error: {e}")
             logger.error(f"SSL handshake error: {e}")
             raise
 
         # Get outgoing data
         outgoing = self._outgoing_bio.read()
-        if outgoing:
-            print(f"[SSL] Generated {len(outgoing)} bytes of outgoing data")
+        if outgoing and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SSL] Generated %s bytes of outgoing data", len(outgoing))
 
         return outgoing, self._handshake_complete
 
@@ -329,12 +371,13 @@ class SSLHandler:
         self._ssl_object.write(data)
         return self._outgoing_bio.read()
 
-    def decrypt(self, data: bytes) -> bytes:
+    def decrypt(self, data: BytesLike) -> bytearray:
         """
         Decrypt received data.
 
         Args:
-            data: Encrypted data
+            data: Encrypted data; any bytes-like object, such as a view
+                  into a pooled message buffer, is passed to the BIO as is
 
         Returns:
             Decrypted plaintext
@@ -344,13 +387,14 @@ class SSLHandler:
 
         self._incoming_bio.write(data)
 
-        decrypted = b''
+        scratch = self._decrypt_view
+        decrypted = bytearray()
         try:
             while True:
-                chunk = self._ssl_object.read(16384)
-                if not chunk:
+                n = self._ssl_object.read(len(scratch), scratch)
+                if not n:
                     break
-                decrypted += chunk
+                decrypted += scratch[:n]
         except ssl.SSLWantReadError:
             pass
 
@@ -376,8 +420,16 @@ class SSLHandler:
                 server_hostname=None if as_server else "android.auto"
             )
 
+    @staticmethod
+    def _format_fingerprint(cert: x509.Certificate) -> str:
+        """Format a certificate's SHA256 fingerprint as colon-separated hex."""
+        return cert.fingerprint(hashes.SHA256()).hex(":").upper()
+
     def get_certificate_fingerprint(self) -> Optional[str]:
         """Get SHA256 fingerprint of the head unit certificate."""
+        if self._cert_fingerprint is not None:
+            return self._cert_fingerprint
+
         if not self._config.cert_path or not self._config.cert_path.exists():
             return None
 
@@ -386,9 +438,9 @@ class SSLHandler:
                 cert_data = f.read()
 
             cert = x509.load_pem_x509_certificate(cert_data, default_backend())
-            fingerprint = cert.fingerprint(hashes.SHA256())
+            self._cert_fingerprint = self._format_fingerprint(cert)
 
-            return ":".join(f"{b:02X}" for b in fingerprint)
+            return self._cert_fingerprint
 
         except Exception as e:
             logger.error(f"Failed to get certificate fingerprint: {e}")
@@ -11,19 +11,56 @@ The phone's head unit server listens on port 5277 after:
 
 Use ADB port forwarding to connect:
     adb forward tcp:5277 tcp:5277
+
+On Linux/macOS a Unix socket forward skips the loopback TCP stack; pass
+the host as "unix:<path>" (the port is then ignored):
+    adb forward localfilesystem:/tmp/aa.sock tcp:5277
 """
 
+import selectors
 import socket
 import threading
+import errno
 import logging
+import os
+import queue
+import random
 import time
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Iterable, Tuple, Union
 from enum import Enum
 
 from PySide6.QtCore import QObject, Signal
 
 logger = logging.getLogger(__name__)
 
+# connect_ex() results for a non-blocking connect still in progress, and
+# for a refused one (Windows reports WSA codes)
+_CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN,
+                    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+_CONNECT_REFUSED = {errno.ECONNREFUSED,
+                    getattr(errno, "WSAECONNREFUSED", errno.ECONNREFUSED)}
+
+# Receive buffers shared by all transports: one is held only while a read
+# loop runs, so idle transports keep no buffer memory. Reads are copied out
+# before emitting, so a buffer is free to reuse once its loop exits.
+_RECV_BUFFER_SIZE = 65536
+_RECV_POOL_MAX = 32
+_RECV_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue()
+
+
+def _acquire_recv_buffer() -> bytearray:
+    """Get a receive buffer from the shared pool, or allocate one."""
+    try:
+        return _RECV_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_RECV_BUFFER_SIZE)
+
+
+def _release_recv_buffer(buffer: bytearray):
+    """Return a receive buffer to the shared pool, up to its cap."""
+    if _RECV_POOL.qsize() < _RECV_POOL_MAX:
+        _RECV_POOL.put_nowait(buffer)
+
 
 class TCPState(Enum):
     """TCP connection states."""
@@ -52,22 +89,58 @@ class TCPTransport(QObject):
     DEFAULT_PORT = 5277
     DEFAULT_HOST = "127.0.0.1"
 
-    def __init__(self, host: str = None, port: int = None, parent=None):
+    # Longest a write may block on a phone that stops reading. Writes come
+    # from the GUI thread, so they must not wait forever.
+    WRITE_TIMEOUT = 2.0
+
+    # (level, option, value) set on each connection socket. Nagle's
+    # algorithm is disabled so small control frames aren't held back
+    # waiting for delayed ACKs.
+    DEFAULT_SOCKET_OPTIONS: List[Tuple[int, int, int]] = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    ]
+
+    # Kernel socket buffer sizes, large enough to absorb a burst of video
+    # frames without stalling the sender. Set before connect so the TCP
+    # window scale is negotiated for them.
+    DEFAULT_RECV_BUFFER_SIZE = 1 << 20
+    DEFAULT_SEND_BUFFER_SIZE = 1 << 20
+
+    def __init__(self, host: str = None, port: int = None, parent=None,
+                 socket_options: Optional[Iterable[Tuple[int, int, int]]] = None,
+                 recv_buffer_size: Optional[int] = DEFAULT_RECV_BUFFER_SIZE,
+                 send_buffer_size: Optional[int] = DEFAULT_SEND_BUFFER_SIZE):
         super().__init__(parent)
 
         self._host = host or self.DEFAULT_HOST
         self._port = port or self.DEFAULT_PORT
+        self._socket_options = list(
+            self.DEFAULT_SOCKET_OPTIONS if socket_options is None else socket_options
+        )
+        # None or 0 leaves the kernel default
+        if recv_buffer_size:
+            self._socket_options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer_size))
+        if send_buffer_size:
+            self._socket_options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size))
         self._socket: Optional[socket.socket] = None
         self._state = TCPState.DISCONNECTED
         self._running = False
-        self._connect_thread: Optional[threading.Thread] = None
-        self._read_thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+        # Single worker thread: connects, reads, and reconnects
+        self._thread: Optional[threading.Thread] = None
+
+        # stop() writes a byte here to wake the read loop's selector, so the
+        # loop can block without a timeout
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
 
-        # Reconnection settings
+        # Reconnection settings. The delay doubles with each consecutive
+        # failure up to _max_reconnect_delay, plus up to 0.5 s of jitter.
         self._auto_reconnect = True
         self._reconnect_delay = 2.0
-        self._max_reconnect_attempts = 10
+        self._max_reconnect_delay = 30.0
+        # Consecutive failed attempts before giving up and reporting an error
+        self._max_reconnect_attempts = 20
 
     @property
     def is_connected(self) -> bool:
@@ -84,7 +157,7 @@ class TCPTransport(QObject):
         if self._state != state:
             self._state = state
             self.stateChanged.emit(state.value)
-            logger.info(f"TCP transport state: {state.value}")
+            logger.info("TCP transport state: %s", state.value)
 
     def start(self):
         """Start TCP transport and attempt connection."""
@@ -92,184 +165,353 @@ class TCPTransport(QObject):
             return
 
         self._running = True
-        self._connect_thread = threading.Thread(target=self._connection_loop, daemon=True)
-        self._connect_thread.start()
-        logger.info(f"TCP transport started, connecting to {self._host}:{self._port}")
+        self._drain_wakeups()
+        self._thread = threading.Thread(target=self._connection_loop, daemon=True)
+        self._thread.start()
+        logger.info("TCP transport started, connecting to %s:%s", self._host, self._port)
 
     def stop(self):
         """Stop TCP transport and disconnect."""
         self._running = False
         self._auto_reconnect = False
+        self._wake()
+        self._close_socket()
 
-        if self._socket:
-            try:
-                self._socket.close()
-            except Exception:
-                pass
-            self._socket = None
-
-        if self._connect_thread:
-            self._connect_thread.join(timeout=2.0)
-            self._connect_thread = None
-
-        if self._read_thread:
-            self._read_thread.join(timeout=2.0)
-            self._read_thread = None
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
 
         self._set_state(TCPState.DISCONNECTED)
         logger.info("TCP transport stopped")
 
     def _connection_loop(self):
-        """Background thread to manage connection."""
-        attempt = 0
+        """Background thread: connect, read until disconnected, then reconnect."""
+        failures = 0
 
         while self._running:
-            if self._state == TCPState.CONNECTED:
-                # Already connected, wait a bit before checking again
-                time.sleep(1.0)
-                continue
-
-            attempt += 1
-            print(f"[AA TCP] Connection attempt {attempt}/{self._max_reconnect_attempts}")
-
-            if attempt > self._max_reconnect_attempts:
-                print(f"[AA TCP] Max reconnection attempts reached")
-                self.error.emit("Failed to connect to phone's head unit server")
-                break
+            logger.info("[AA TCP] Connection attempt %s/%s", failures + 1, self._max_reconnect_attempts)
 
             try:
                 self._connect()
-                attempt = 0  # Reset on successful connection
             except Exception as e:
-                print(f"[AA TCP] Connection failed: {e}")
-                logger.error(f"TCP connection failed: {e}")
+                logger.error("TCP connection failed: %s", e)
+                failures += 1
+
+                if not self._running:
+                    # Cancelled by stop()
+                    break
 
                 if not self._auto_reconnect:
                     self.error.emit(f"Connection failed: {e}")
                     break
 
-                time.sleep(self._reconnect_delay)
+                if failures >= self._max_reconnect_attempts:
+                    logger.warning("[AA TCP] Max reconnection attempts reached")
+                    self.error.emit("Failed to connect to phone's head unit server")
+                    break
+
+                # stop() cuts the delay short through the wakeup socket
+                self._wait_for_wakeup(self._backoff_delay(failures))
+                continue
+
+            failures = 0  # Reset the backoff on successful connection
+            # Returns once the connection is lost or the transport stopped
+            self._read_loop()
+
+    def _address(self) -> Tuple[int, Union[str, Tuple[str, int]]]:
+        """Get the socket family and address to connect to."""
+        if self._host.startswith("unix:") and hasattr(socket, "AF_UNIX"):
+            return socket.AF_UNIX, self._host[len("unix:"):]
+        return socket.AF_INET, (self._host, self._port)
+
+    def _backoff_delay(self, failures: int) -> float:
+        """Get the delay before the next attempt after `failures` in a row."""
+        delay = self._reconnect_delay * (1 << min(failures - 1, 5))
+        return min(self._max_reconnect_delay, delay) + random.random() * 0.5
 
     def _connect(self):
         """Establish TCP connection."""
         self._set_state(TCPState.CONNECTING)
-        print(f"[AA TCP] Connecting to {self._host}:{self._port}...")
-
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.settimeout(5.0)  # Connection timeout
+        logger.info("[AA TCP] Connecting to %s:%s...", self._host, self._port)
+
+        family, address = self._address()
+        # Python sockets are non-inheritable already; SOCK_CLOEXEC just
+        # sets that at creation where supported
+        sock = socket.socket(family, socket.SOCK_STREAM | getattr(socket, "SOCK_CLOEXEC", 0))
+        self._socket = sock
+        for level, option, value in self._socket_options:
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError as e:
+                # Tuning only - the connection works without it
+                logger.debug("Could not set socket option %s/%s: %s", level, option, e)
 
         try:
-            self._socket.connect((self._host, self._port))
-            self._socket.settimeout(1.0)  # Read timeout
+            self._connect_socket(sock, address, timeout=5.0)
+
+            # Linux only: ACK immediately instead of delaying, which pairs
+            # with TCP_NODELAY for small control frames
+            quickack = getattr(socket, "TCP_QUICKACK", None)
+            if quickack is not None:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, quickack, 1)
+                except OSError as e:
+                    logger.debug("Could not set TCP_QUICKACK: %s", e)
 
-            print(f"[AA TCP] Connected!")
-            logger.info(f"TCP connected to {self._host}:{self._port}")
+            logger.info("TCP connected to %s:%s", self._host, self._port)
 
             self._set_state(TCPState.CONNECTED)
             self.deviceConnected.emit(self)
 
-            # Start read thread
-            self._read_thread = threading.Thread(target=self._read_loop, daemon=True)
-            self._read_thread.start()
-
         except socket.timeout:
-            print(f"[AA TCP] Connection timeout")
-            self._socket.close()
-            self._socket = None
+            logger.info("[AA TCP] Connection timeout")
+            self._discard_socket(sock)
             raise Exception("Connection timeout - is ADB forwarding active?")
         except ConnectionRefusedError:
-            print(f"[AA TCP] Connection refused")
-            self._socket.close()
-            self._socket = None
+            logger.info("[AA TCP] Connection refused")
+            self._discard_socket(sock)
             raise Exception("Connection refused - start head unit server on phone")
         except Exception as e:
-            print(f"[AA TCP] Connection error: {e}")
-            if self._socket:
-                self._socket.close()
-                self._socket = None
+            logger.info("[AA TCP] Connection error: %s", e)
+            self._discard_socket(sock)
             raise
 
+    def _discard_socket(self, sock: socket.socket):
+        """Close a failed connection socket (stop() may have cleared it already)."""
+        if self._socket is sock:
+            self._socket = None
+        sock.close()
+
+    def _connect_socket(self, sock: socket.socket, address, timeout: float):
+        """
+        Connect without blocking, waiting on a selector so that stop() can
+        cancel the attempt. The socket is left in blocking mode, with
+        WRITE_TIMEOUT bounding sends.
+        """
+        sock.setblocking(False)
+        err = sock.connect_ex(address)
+
+        if err in _CONNECT_PENDING:
+            deadline = time.monotonic() + timeout
+            with selectors.DefaultSelector() as selector:
+                selector.register(sock, selectors.EVENT_WRITE)
+                selector.register(self._wake_r, selectors.EVENT_READ)
+                while True:
+                    remaining = deadline - time.monotonic()
+                    events = selector.select(remaining) if remaining > 0 else []
+                    if not events:
+                        raise socket.timeout("timed out")
+                    if any(key.fileobj is self._wake_r for key, _ in events):
+                        self._drain_wakeups()
+                        if not self._running:
+                            raise OSError("Connection cancelled")
+                    if any(key.fileobj is sock for key, _ in events):
+                        break
+
+            # Writable means the connect finished, successfully or not
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+
+        if err in _CONNECT_REFUSED:
+            raise ConnectionRefusedError(err, os.strerror(err))
+        if err:
+            raise OSError(err, os.strerror(err))
+
+        # Blocking again, but with sends bounded; the read loop waits on a
+        # selector, so its reads never hit the timeout
+        sock.settimeout(self.WRITE_TIMEOUT)
+
     def _read_loop(self):
-        """Background thread to read data from socket."""
-        print(f"[AA TCP] Read loop started")
+        """Read data from the socket until disconnected (on the worker thread)."""
+        logger.debug("[AA TCP] Read loop started")
         error_count = 0
         max_errors = 5
 
-        while self._running and self._state == TCPState.CONNECTED:
+        # Read into one pooled buffer for the whole connection instead of
+        # recv() allocating a fresh bytes object per read. Back-to-back reads
+        # are coalesced into it, so one dataReceived carries up to 64KB.
+        read_buffer = _acquire_recv_buffer()
+        read_view = memoryview(read_buffer)
+        capacity = len(read_buffer)
+
+        # Wait for data or a wakeup from stop(), with no idle polling
+        sock = self._socket
+        selector = selectors.DefaultSelector()
+        try:
+            if sock:
+                selector.register(sock, selectors.EVENT_READ)
+                selector.register(self._wake_r, selectors.EVENT_READ)
+        except (OSError, ValueError) as e:
+            logger.error("[AA TCP] Could not watch socket: %s", e)
+            sock = None
+
+        while sock and self._running and self._state == TCPState.CONNECTED:
             try:
                 if not self._socket:
                     break
 
-                # Read data (16KB buffer like USB)
-                data = self._socket.recv(16384)
-
-                if not data:
+                events = selector.select()
+                if any(key.fileobj is self._wake_r for key, _ in events):
+                    self._drain_wakeups()
+                    continue
+
+                # Keep reading while more data is already waiting, then emit
+                # it all at once rather than one signal per recv
+                filled = 0
+                closed = False
+                while True:
+                    length = sock.recv_into(read_view[filled:])
+                    if not length:
+                        closed = True
+                        break
+                    filled += length
+                    if filled >= capacity:
+                        break
+                    ready = selector.select(0)
+                    if not any(key.fileobj is sock for key, _ in ready):
+                        break
+
+                if filled:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[AA TCP] Received %s bytes", filled)
+                    self.dataReceived.emit(bytes(read_view[:filled]))
+                    error_count = 0
+
+                if closed:
                     # Connection closed by remote
-                    print(f"[AA TCP] Connection closed by phone")
+                    logger.info("[AA TCP] Connection closed by phone")
                     break
 
-                print(f"[AA TCP] Received {len(data)} bytes")
-                self.dataReceived.emit(data)
-                error_count = 0
-
-            except socket.timeout:
-                # Timeout is normal, continue
-                continue
             except ConnectionResetError:
-                print(f"[AA TCP] Connection reset by phone")
+                logger.info("[AA TCP] Connection reset by phone")
                 break
             except OSError as e:
                 error_count += 1
-                print(f"[AA TCP] Socket error ({error_count}/{max_errors}): {e}")
+                logger.warning("[AA TCP] Socket error (%s/%s): %s", error_count, max_errors, e)
 
                 if error_count >= max_errors:
                     break
 
                 time.sleep(0.1)
             except Exception as e:
-                print(f"[AA TCP] Unexpected error: {e}")
-                logger.error(f"TCP read error: {e}")
+                logger.error("TCP read error: %s", e)
                 break
 
-        print(f"[AA TCP] Read loop ended")
+        selector.close()
+        _release_recv_buffer(read_buffer)
+        logger.debug("[AA TCP] Read loop ended")
         self._disconnect()
 
+    def _wake(self):
+        """Interrupt a selector wait in the transport's threads."""
+        try:
+            self._wake_w.send(b'x')
+        except OSError:
+            # Already pending (buffer full) - one byte is enough
+            pass
+
+    def _wait_for_wakeup(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds; returns True if woken by _wake()."""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            return bool(selector.select(timeout))
+
+    def _drain_wakeups(self):
+        """Discard pending wakeup bytes."""
+        try:
+            while self._wake_r.recv(64):
+                pass
+        except OSError:
+            pass
+
+    def _close_socket(self):
+        """Close the connection socket, if this caller is the one to take it."""
+        # Take the socket in one swap instead of under a lock: stop() and the
+        # read thread normally don't overlap here, and if they ever both get
+        # it, socket.close() is idempotent
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.close()
+            except Exception:
+                pass
+
     def _disconnect(self):
         """Handle disconnection."""
-        with self._lock:
-            if self._socket:
-                try:
-                    self._socket.close()
-                except Exception:
-                    pass
-                self._socket = None
+        self._close_socket()
+
+        if self._state != TCPState.DISCONNECTED:
+            self._set_state(TCPState.DISCONNECTED)
+            self.deviceDisconnected.emit()
+
+    def writev(self, chunks: List[bytes]) -> bool:
+        """Write several buffers with vectored sends, without joining them."""
+        sock = self._socket
+        sendmsg = getattr(sock, "sendmsg", None)
+        if sendmsg is None:
+            # No sendmsg on Windows (or not connected - write() reports it)
+            return self.write(b''.join(chunks))
+
+        if not self.is_connected:
+            logger.warning("[AA TCP] Write failed: not connected")
+            return False
 
-            if self._state != TCPState.DISCONNECTED:
-                self._set_state(TCPState.DISCONNECTED)
-                self.deviceDisconnected.emit()
+        try:
+            pending = list(chunks)
+            total = 0
+            while pending:
+                sent = sendmsg(pending)
+                total += sent
+
+                # Drop the chunks sent in full; keep the rest of a partial one
+                done = 0
+                while done < len(pending) and sent >= len(pending[done]):
+                    sent -= len(pending[done])
+                    done += 1
+                del pending[:done]
+                if sent:
+                    pending[0] = memoryview(pending[0])[sent:]
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[AA TCP] Write: %s bytes in %s chunks", total, len(chunks))
+            return True
 
-    def write(self, data: bytes) -> bool:
+        except socket.timeout:
+            self._abort_stalled_write()
+            return False
+        except Exception as e:
+            logger.error("TCP write error: %s", e)
+            return False
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> bool:
         """Write data to the socket."""
-        if not self.is_connected or not self._socket:
-            print(f"[AA TCP] Write failed: not connected")
+        sock = self._socket
+        if not self.is_connected or not sock:
+            logger.warning("[AA TCP] Write failed: not connected")
             return False
 
         try:
-            total_sent = 0
-            while total_sent < len(data):
-                sent = self._socket.send(data[total_sent:])
-                if sent == 0:
-                    raise RuntimeError("Socket connection broken")
-                total_sent += sent
-
-            print(f"[AA TCP] Write: {total_sent}/{len(data)} bytes")
+            # sendall loops over short sends in C, straight from the buffer
+            sock.sendall(data)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[AA TCP] Write: %s bytes", len(data))
             return True
 
+        except socket.timeout:
+            self._abort_stalled_write()
+            return False
         except Exception as e:
-            print(f"[AA TCP] Write error: {e}")
-            logger.error(f"TCP write error: {e}")
+            logger.error("TCP write error: %s", e)
             return False
 
+    def _abort_stalled_write(self):
+        """Drop a connection whose write timed out part-way through a frame."""
+        logger.error("[AA TCP] Write timed out after %ss, dropping connection", self.WRITE_TIMEOUT)
+        # The stream is now cut mid-frame; the read loop sees the closed
+        # socket on wakeup and disconnects (then reconnects)
+        self._close_socket()
+        self._wake()
+
     def set_host_port(self, host: str, port: int):
         """Update connection parameters (must call before start)."""
         self._host = host
@@ -8,6 +8,7 @@ Based on the Android Open Accessory Protocol 2.0 specification
 and the aasdk library implementation.
 """
 
+import array
 import os
 import sys
 import time
@@ -92,8 +93,7 @@ except ImportError as e:
 from .constants import (
     USBIds,
     AOAPRequest,
-    AOAPStringType,
-    AccessoryInfo,
+    AOAP_ACCESSORY_STRINGS,
     USBConstants,
 )
 
@@ -163,6 +163,10 @@ class USBTransport(QObject):
         self._aoap_fail_count = 0
         self._max_aoap_fails = 3
 
+        # Size of each bulk IN read; tune down for devices that misbehave
+        # with large transfers
+        self.bulk_chunk_size = USBConstants.BULK_TRANSFER_SIZE
+
     @property
     def device(self) -> Optional[USBDevice]:
         """Get the currently connected device."""
@@ -410,17 +414,7 @@ class USBTransport(QObject):
                     pass
 
             # Send accessory identification strings
-            strings = [
-                (AOAPStringType.MANUFACTURER, AccessoryInfo.MANUFACTURER),
-                (AOAPStringType.MODEL, AccessoryInfo.MODEL),
-                (AOAPStringType.DESCRIPTION, AccessoryInfo.DESCRIPTION),
-                (AOAPStringType.VERSION, AccessoryInfo.VERSION),
-                (AOAPStringType.URI, AccessoryInfo.URI),
-                (AOAPStringType.SERIAL, AccessoryInfo.SERIAL),
-            ]
-
-            for string_type, value in strings:
-                data = value.encode('utf-8') + b'\x00'
+            for string_type, data in AOAP_ACCESSORY_STRINGS:
                 device.ctrl_transfer(
                     USBConstants.ENDPOINT_OUT | USBConstants.TYPE_VENDOR,
                     AOAPRequest.SEND_STRING,
@@ -429,7 +423,7 @@ class USBTransport(QObject):
                     data,
                     USBConstants.TIMEOUT_MS
                 )
-                logger.debug(f"Sent AOAP string {string_type.name}: {value}")
+                logger.debug("Sent AOAP string %s: %s", string_type.name, data)
 
             # Send start command
             device.ctrl_transfer(
@@ -555,16 +549,24 @@ class USBTransport(QObject):
         error_count = 0
         max_errors = 5
 
+        # libusb fills this buffer in place on every transfer instead of
+        # pyusb allocating a fresh bulk_chunk_size array per read
+        read_buffer = array.array('B', bytes(self.bulk_chunk_size))
+        read_view = memoryview(read_buffer)
+
         while self._running and self._device and self._device.state == DeviceState.CONNECTED:
             try:
                 if not self._device or not self._device.in_endpoint:
                     break
 
-                # Read data (16KB buffer)
-                data = self._device.in_endpoint.read(16384, timeout=1000)
-                if data:
-                    print(f"[AA] Received {len(data)} bytes")
-                    self.dataReceived.emit(bytes(data))
+                # Read data (large bulk transfer, completes early on short packet)
+                length = self._device.in_endpoint.read(read_buffer, timeout=1000)
+                if length:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[AA] Received %s bytes", length)
+                    # The one copy: the signal is queued to another thread
+                    # while the buffer is refilled
+                    self.dataReceived.emit(bytes(read_view[:length]))
                     error_count = 0  # Reset on success
 
             except usb.core.USBTimeoutError:
@@ -592,6 +594,10 @@ class USBTransport(QObject):
 
         print(f"[AA] Read loop ended")
 
+    def writev(self, chunks: List[bytes]) -> bool:
+        """Write several buffers as a single bulk transfer."""
+        return self.write(b''.join(chunks))
+
     def write(self, data: bytes, retries: int = 3) -> bool:
         """Write data to the connected device with retry logic."""
         if not self.is_connected or not self._device or not self._device.out_endpoint:
@@ -601,7 +607,8 @@ class USBTransport(QObject):
         for attempt in range(retries):
             try:
                 bytes_written = self._device.out_endpoint.write(data, timeout=USBConstants.TIMEOUT_MS)
-                print(f"[AA] Write: {bytes_written}/{len(data)} bytes")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[AA] Write: %s/%s bytes", bytes_written, len(data))
                 return bytes_written == len(data)
             except usb.core.USBTimeoutError as e:
                 print(f"[AA] USB write timeout (attempt {attempt + 1}/{retries}): {e}")
@@ -7,15 +7,32 @@ and provides frames ready for display in Qt/QML.
 
 import av
 import logging
+import platform
 import threading
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Union
 from collections import deque
 
 from PySide6.QtCore import QObject, Signal, QByteArray
 from PySide6.QtGui import QImage
 
+from .constants import VideoHWAccel
+
+# Hardware decode through FFmpeg hwaccels (PyAV >= 14)
+try:
+    from av.codec.hwaccel import HWAccel
+    _hwaccel_api_available = True
+except ImportError:
+    _hwaccel_api_available = False
+
 logger = logging.getLogger(__name__)
 
+# Backends tried in order for VideoHWAccel.AUTO
+_AUTO_HWACCELS = {
+    "Windows": [VideoHWAccel.D3D11VA, VideoHWAccel.CUDA],
+    "Linux": [VideoHWAccel.VAAPI, VideoHWAccel.CUDA],
+    "Darwin": [VideoHWAccel.VIDEOTOOLBOX],
+}
+
 
 class VideoDecoder(QObject):
     """
@@ -31,13 +48,18 @@ class VideoDecoder(QObject):
     decodingStopped = Signal()
     error = Signal(str)
 
-    def __init__(self, width: int = 800, height: int = 480, parent=None):
+    def __init__(self, width: int = 800, height: int = 480,
+                 hwaccel: Union[VideoHWAccel, str] = VideoHWAccel.AUTO, parent=None):
         super().__init__(parent)
 
         self._width = width
         self._height = height
         self._running = False
 
+        # Requested and active hardware acceleration
+        self._hwaccel = VideoHWAccel(hwaccel)
+        self._active_hwaccel = VideoHWAccel.NONE
+
         # Decoder state
         self._codec: Optional[av.Codec] = None
         self._codec_context: Optional[av.CodecContext] = None
@@ -51,18 +73,34 @@ class VideoDecoder(QObject):
         self._init_decoder()
 
     def _init_decoder(self):
-        """Initialize the H.264 decoder."""
+        """Initialize the H.264 decoder, preferring hardware decode."""
+        for accel in self._hwaccel_candidates():
+            try:
+                if _hwaccel_api_available:
+                    context = av.CodecContext.create(
+                        'h264', 'r',
+                        hwaccel=HWAccel(device_type=accel.value, allow_software_fallback=True)
+                    )
+                elif accel == VideoHWAccel.CUDA:
+                    # Older PyAV: use FFmpeg's standalone NVDEC decoder
+                    context = av.Codec('h264_cuvid', 'r').create()
+                else:
+                    continue
+
+                self._open_codec_context(context)
+                self._active_hwaccel = accel
+                logger.info(f"H.264 decoder initialized ({self._width}x{self._height}, hwaccel={accel.value})")
+                return
+
+            except Exception as e:
+                logger.info(f"Hardware decode via {accel.value} unavailable: {e}")
+
         try:
             self._codec = av.Codec('h264', 'r')
-            self._codec_context = self._codec.create()
-
-            # Configure decoder
-            self._codec_context.width = self._width
-            self._codec_context.height = self._height
-            self._codec_context.pix_fmt = 'yuv420p'
-
-            # Open decoder
-            self._codec_context.open()
+            context = self._codec.create()
+            context.pix_fmt = 'yuv420p'
+            self._open_codec_context(context)
+            self._active_hwaccel = VideoHWAccel.NONE
 
             logger.info(f"H.264 decoder initialized ({self._width}x{self._height})")
 
@@ -70,6 +108,21 @@ class VideoDecoder(QObject):
             logger.error(f"Failed to initialize H.264 decoder: {e}")
             self.error.emit(f"Decoder initialization failed: {e}")
 
+    def _hwaccel_candidates(self) -> List[VideoHWAccel]:
+        """Hardware backends to try, in order, for the requested hwaccel."""
+        if self._hwaccel == VideoHWAccel.NONE:
+            return []
+        if self._hwaccel == VideoHWAccel.AUTO:
+            return _AUTO_HWACCELS.get(platform.system(), [])
+        return [self._hwaccel]
+
+    def _open_codec_context(self, context: av.CodecContext):
+        """Configure and open a decoder context."""
+        context.width = self._width
+        context.height = self._height
+        context.open()
+        self._codec_context = context
+
     def start(self):
         """Start the decoder."""
         if self._running:
@@ -94,40 +147,42 @@ class VideoDecoder(QObject):
         self.decodingStopped.emit()
         logger.info("Video decoder stopped")
 
-    def feed(self, data: bytes):
+    def feed(self, data: Union[bytes, memoryview]):
         """
         Feed H.264 NAL unit data to the decoder.
 
+        The data is copied straight into an FFmpeg packet before returning,
+        so it may be a memoryview into a buffer that is reused afterwards
+        (such as payloads passed to AndroidAutoManager.set_video_sink()).
+
         Args:
             data: H.264 encoded video data
         """
+        packet = av.Packet(data)
         with self._lock:
-            self._frame_queue.append(data)
+            self._frame_queue.append(packet)
 
     def _decode_loop(self):
         """Background thread for decoding video frames."""
         while self._running:
-            data = None
+            packet = None
 
             with self._lock:
                 if self._frame_queue:
-                    data = self._frame_queue.popleft()
+                    packet = self._frame_queue.popleft()
 
-            if data:
-                self._decode_frame(data)
+            if packet is not None:
+                self._decode_frame(packet)
             else:
                 # Wait a bit if no data
                 threading.Event().wait(0.001)
 
-    def _decode_frame(self, data: bytes):
-        """Decode a single frame from H.264 data."""
+    def _decode_frame(self, packet: av.Packet):
+        """Decode a single frame from an H.264 packet."""
         if not self._codec_context:
             return
 
         try:
-            # Create packet from data
-            packet = av.Packet(data)
-
             # Decode
             for frame in self._codec_context.decode(packet):
                 # Convert to RGB
@@ -201,6 +256,11 @@ class VideoDecoder(QObject):
         """Check if decoder is running."""
         return self._running
 
+    @property
+    def active_hwaccel(self) -> VideoHWAccel:
+        """Get the hardware acceleration backend actually in use."""
+        return self._active_hwaccel
+
 
 class VideoFrameProvider(QObject):
     """
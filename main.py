@@ -1,6 +1,7 @@
 import sys
 import os
 import platform
+import logging
 
 # Check system type FIRST
 system_name = platform.system()
@@ -45,6 +46,13 @@ from backend.obd_manager import OBDManager
 from backend.spotify_manager import SpotifyManager
 from backend.android_auto import AndroidAutoManager, WindowContainer
 
+# Android Auto reports connection progress through logging
+android_auto_log_handler = logging.StreamHandler()
+android_auto_log_handler.setFormatter(logging.Formatter("%(message)s"))
+android_auto_logger = logging.getLogger("backend.android_auto")
+android_auto_logger.addHandler(android_auto_log_handler)
+android_auto_logger.setLevel(logging.INFO)
+
 app = QApplication(sys.argv)
 engine = QQmlApplicationEngine()
 